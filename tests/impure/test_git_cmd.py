@@ -0,0 +1,139 @@
+'''
+Tests of the low-level git command interface, against repositories
+created for each test.
+'''
+
+from pathlib import Path
+from subprocess import run
+
+import pytest
+
+from xontrib.xgit.git_cmd import _GitCmd
+from xontrib.xgit.types import GitException
+
+
+def git(path: Path, *args: str) -> str:
+    return run(['git', '-C', str(path), *args],
+               check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture()
+def f_new_repo(tmp_path):
+    '''
+    Create a repository in `tmp_path`, with one commit. Returns a function
+    taking the repository's name and returning its path.
+    '''
+    def new_repo(name: str) -> Path:
+        path = tmp_path / name
+        git(tmp_path, 'init', '-q', name)
+        (path / 'file').write_text(name)
+        git(path, 'add', 'file')
+        git(path, '-c', 'user.name=Test', '-c', 'user.email=test@example.com',
+            'commit', '-q', '-m', name)
+        return path
+    return new_repo
+
+
+def test_rev_parse_follows_cwd(f_new_repo, monkeypatch):
+    '''
+    Without a path of its own, a `_GitCmd` resolves revisions in
+    the current directory, even after it changes.
+    '''
+    a, b = f_new_repo('a'), f_new_repo('b')
+    cmd = _GitCmd()
+    monkeypatch.chdir(a)
+    assert cmd.rev_parse('HEAD') == git(a, 'rev-parse', 'HEAD')
+    monkeypatch.chdir(b)
+    assert cmd.rev_parse('HEAD') == git(b, 'rev-parse', 'HEAD')
+    cmd.close()
+
+
+def test_cat_file_check(f_new_repo):
+    '''
+    Test getting object metadata from the persistent `cat-file` process.
+    '''
+    path = f_new_repo('repo')
+    cmd = _GitCmd(path)
+    commit = git(path, 'rev-parse', 'HEAD')
+    assert cmd.cat_file_check('HEAD')[:2] == (commit, 'commit')
+    assert cmd.cat_file_check('HEAD:file')[1:] == ('blob', 4)
+    assert cmd.cat_file_batch('HEAD:file') == b'repo'
+    cmd.close()
+
+
+def test_cat_file_batch(f_new_repo):
+    '''
+    Test getting object content from the persistent `cat-file` process.
+    '''
+    path = f_new_repo('repo')
+    cmd = _GitCmd(path)
+    tree = git(path, 'rev-parse', 'HEAD^{tree}')
+    commit = cmd.cat_file_batch('HEAD')
+    assert commit.startswith(f'tree {tree}\n'.encode())
+    # The process is reused across requests.
+    assert cmd.cat_file_batch('HEAD') == commit
+    cmd.close()
+
+
+@pytest.mark.parametrize('missing', ['0' * 40, 'HEAD:no such', 'HEAD:no such file'])
+def test_cat_file_missing(f_new_repo, missing):
+    '''
+    Test that a missing object is reported, including a path with
+    spaces, and that the process can still be used afterwards.
+    '''
+    cmd = _GitCmd(f_new_repo('repo'))
+    with pytest.raises(GitException):
+        cmd.cat_file_check(missing)
+    with pytest.raises(GitException):
+        cmd.cat_file_batch(missing)
+    with pytest.raises(GitException):
+        cmd.cat_file_check_many('HEAD', missing, 'HEAD:file')
+    with pytest.raises(GitException):
+        cmd.cat_file_batch_many(missing, 'HEAD:file')
+    assert cmd.cat_file_check('HEAD:file')[1] == 'blob'
+    assert cmd.cat_file_batch_many('HEAD:file') == [
+        (cmd.cat_file_check('HEAD:file')[0], 'blob', b'repo')
+    ]
+    cmd.close()
+
+
+def test_cat_file_newline(f_new_repo):
+    '''
+    Test that a spec with a newline is refused, rather than being sent
+    as two requests and leaving later replies out of step.
+    '''
+    path = f_new_repo('repo')
+    cmd = _GitCmd(path)
+    commit = git(path, 'rev-parse', 'HEAD')
+    with pytest.raises(GitException):
+        cmd.cat_file_check('HEAD\nHEAD^{tree}')
+    with pytest.raises(GitException):
+        cmd.cat_file_batch_many('HEAD', 'HEAD\nHEAD^{tree}')
+    assert cmd.cat_file_check('HEAD')[:2] == (commit, 'commit')
+    assert cmd.cat_file_batch_many('HEAD')[0][:2] == (commit, 'commit')
+    cmd.close()
+
+
+def test_rev_parse_missing(f_new_repo, monkeypatch):
+    '''
+    Test that an unknown revision raises `GitException`, with or
+    without a fixed path.
+    '''
+    path = f_new_repo('repo')
+    monkeypatch.chdir(path)
+    for cmd in (_GitCmd(path), _GitCmd()):
+        with pytest.raises(GitException):
+            cmd.rev_parse('nonexistent-ref')
+        cmd.close()
+
+
+def test_worktree_locations_relative(f_new_repo, monkeypatch):
+    '''
+    Test that a relative path is taken from the current directory,
+    even after it changes.
+    '''
+    a, b = f_new_repo('a'), f_new_repo('b')
+    monkeypatch.chdir(a)
+    assert _GitCmd(Path('.')).worktree_locations(Path('.'))[0] == a.resolve()
+    monkeypatch.chdir(b)
+    assert _GitCmd(Path('.')).worktree_locations(Path('.'))[0] == b.resolve()
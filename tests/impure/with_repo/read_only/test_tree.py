@@ -48,4 +48,16 @@ def test_tree_entry_get(f_repo):
     entry = tree['.']
     entry = entry['foo']
     assert entry.name == 'foo'
-    assert entry.path == PurePosixPath('./foo')
\ No newline at end of file
+    assert entry.path == PurePosixPath('./foo')
+
+def test_tree_entry_parent(f_repo):
+    '''
+    Test that an entry's parent is the entry for the tree holding it.
+    '''
+    repo = f_repo.repository
+    head = repo.get_ref('refs/heads/main')
+    tree = head.target.tree
+    foo = tree['foo']
+    assert foo.parent is tree['.']
+    assert foo.parent.object is tree
+    assert tree['.'].parent is None
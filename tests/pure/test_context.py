@@ -0,0 +1,24 @@
+'''
+Test the helpers of the git context.
+'''
+
+import pytest
+
+@pytest.mark.parametrize('cmd, subcommand', [
+    ('git init', 'init'),
+    ('git -C dir init', 'init'),
+    ('git -c k=v clone url', 'clone'),
+    ('git --git-dir=repo/.git worktree add ../other', 'worktree'),
+    ('git --git-dir repo/.git --work-tree . submodule update', 'submodule'),
+    ('git --no-pager -p status', 'status'),
+    ('git -C dir', None),
+    ('gitk --all', None),
+    ('ls', None),
+    ('', None),
+])
+def test_git_subcommand(cmd, subcommand):
+    '''
+    The subcommand is found after any global options.
+    '''
+    from xontrib.xgit.context import _git_subcommand
+    assert _git_subcommand(cmd) == subcommand
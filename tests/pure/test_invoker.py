@@ -68,6 +68,28 @@ def invoker_short_flag():
     assert s.extra_args == []
     assert s.extra_kwargs == {}
 
+def test_invoker_short_flag_cluster():
+    invoker = CommandInvoker(lambda:None, flags = {
+        'x': True,
+        'y': 0,
+    })
+    s = invoker.extract_keywords(['-xy'])
+    assert s.args == []
+    assert s.kwargs == {'x': True, 'y': 'y'}
+    assert s.extra_args == []
+    assert s.extra_kwargs == {}
+
+def test_invoker_repeat_parse_is_independent():
+    invoker = CommandInvoker(lambda:None, flags = {
+        'flag': ('+', 'flag1'),
+        })
+    s1 = invoker.extract_keywords(['--flag', 'a', 'b'])
+    s1.kwargs['flag1'].append('c')
+    s1.args.append('d')
+    s2 = invoker.extract_keywords(['--flag', 'a', 'b'])
+    assert s2.args == []
+    assert s2.kwargs == {'flag1': ['a', 'b']}
+
 def test_invoker_arity_plus():
     invoker = CommandInvoker(lambda:None, flags = {
         'flag': ('+', 'flag1'),
@@ -232,6 +254,14 @@ def test_simple_invoker_invoke_short():
     with raises(ArgumentError):
         invoker.__call__(1, 2)
 
+def test_simple_invoker_inner_type_error():
+    def f(a):
+        return a + 'x'
+    invoker = Invoker(f)
+    with raises(TypeError) as e:
+        invoker.__call__(1)
+    assert not isinstance(e.value, ArgumentError)
+
 def test_simple_invoker_invoke_extra():
     def f(a, b, c):
         return a, b, c
@@ -471,3 +501,31 @@ def test_invoker_repr():
         return  a, b, c, args, session, kwargs
     invoker = CommandInvoker(f, 'f')
     assert repr(invoker) == '<CommandInvoker(f)(...)>'
+
+def test_session_invokers_injected_in_order():
+    '''
+    Invokers are injected in the order they were created, including
+    those with no other reference.
+    '''
+    import gc
+    from xontrib.xgit.invoker import (
+        RunnerPerSessionInvoker, _session_invokers, _inject_all,
+    )
+    injected: list[str] = []
+    class Recorder(RunnerPerSessionInvoker):
+        def inject(self, /, **session_vars):
+            injected.append(self.name)
+        def _register_invoker(self, *args, **kwargs):
+            super()._register_invoker(*args, **kwargs)
+        def _register_runner(self, runner, /, **session_vars):
+            pass
+    saved = list(_session_invokers)
+    try:
+        _session_invokers.clear()
+        for name in ('first', 'second', 'third'):
+            Recorder(lambda: None, name)
+        gc.collect()
+        _inject_all()
+        assert injected == ['first', 'second', 'third']
+    finally:
+        _session_invokers[:] = saved
@@ -0,0 +1,22 @@
+'''
+Tests of the bounded LRU cache.
+'''
+
+def test_lru_evicts_least_recent():
+    from xontrib.xgit.lru import LRUCache
+    cache = LRUCache[str, int](2)
+    cache['a'] = 1
+    cache['b'] = 2
+    assert cache.get('a') == 1
+    cache['c'] = 3
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.get('b') is None
+    assert cache.stats() == {
+        'size': 2,
+        'maxsize': 2,
+        'hits': 3,
+        'misses': 1,
+        'evictions': 1,
+    }
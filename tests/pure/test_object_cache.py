@@ -0,0 +1,31 @@
+'''
+Test the persistent object cache.
+'''
+
+from xontrib.xgit.object_cache import ObjectCache
+
+HASH = 'a' * 40
+
+def test_object_cache_round_trip(tmp_path):
+    '''
+    Data stored is found again, by hash and kind, in a later session.
+    '''
+    cache = ObjectCache.for_repository(tmp_path / 'cache', tmp_path)
+    assert cache.get(HASH, 'object') is None
+    cache.put(HASH, 'object', b'data')
+    cache.close()
+
+    cache = ObjectCache.for_repository(tmp_path / 'cache', tmp_path)
+    assert cache.get(HASH, 'object') == b'data'
+    assert cache.get(HASH, 'ls-tree') is None
+    cache.close()
+
+
+def test_object_cache_closed(tmp_path):
+    '''
+    A closed cache misses, and stores nothing.
+    '''
+    cache = ObjectCache(tmp_path / 'objects.sqlite')
+    cache.close()
+    cache.put(HASH, 'object', b'data')
+    assert cache.get(HASH, 'object') is None
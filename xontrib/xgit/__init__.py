@@ -102,7 +102,7 @@ from xontrib.xgit.decorators import (
     prefix_command,
 )
 from xontrib.xgit.cmds import (
-    git_cd, git_pwd, git_ls,
+    git_cd, git_pwd, git_ls, git_refresh,
 )
 
 __all__ = (  # noqa: RUF022
@@ -111,6 +111,7 @@ __all__ = (  # noqa: RUF022
     "git_cd",
     "git_pwd",
     "git_ls",
+    "git_refresh",
     "ObjectId",
     "CommitId",
     "TreeId",
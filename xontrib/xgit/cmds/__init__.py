@@ -1,9 +1,11 @@
 from xontrib.xgit.cmds.cd import git_cd
 from xontrib.xgit.cmds.pwd import git_pwd
 from xontrib.xgit.cmds.ls import git_ls
+from xontrib.xgit.cmds.refresh import git_refresh
 
 __all__ = [
     "git_cd",
     "git_ls",
     "git_pwd",
+    "git_refresh",
 ]
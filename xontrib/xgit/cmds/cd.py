@@ -1,11 +1,32 @@
 '''
 The xgit-cd command.
 '''
+import os
 from pathlib import Path, PurePosixPath
 import sys
 
 from xontrib.xgit.decorators import command, xgit
 
+def _join(base: Path, path: str) -> Path:
+    '''
+    Join `path` onto the already-resolved `base` and normalize it. This
+    only needs to touch the filesystem to check the added components
+    for symbolic links; if there are any, it falls back to a full resolve.
+    '''
+    if os.path.isabs(path):
+        return Path(path).resolve()
+    loc = str(base)
+    for part in path.split(os.sep):
+        if part in ('', '.'):
+            continue
+        if part == '..':
+            loc = os.path.dirname(loc)
+            continue
+        loc = os.path.join(loc, part)
+        if os.path.islink(loc):
+            return (base / path).resolve()
+    return Path(loc)
+
 @command(
     export=True,
     prefix=(xgit, 'cd'),
@@ -27,8 +48,9 @@ def git_cd(path: str = "", *, XSH, XGIT, stderr=sys.stderr) -> None:
         pass
     else:
         try:
-            loc = (XGIT.worktree.location / XGIT.path / path).resolve()
-            git_path = PurePosixPath(loc.relative_to(XGIT.worktree.location))
+            location = XGIT.worktree.location
+            loc = _join(location / XGIT.path, path)
+            git_path = PurePosixPath(loc.relative_to(location))
             XGIT.path = git_path
             fpath = XGIT.worktree.path / XGIT.path
         except ValueError:
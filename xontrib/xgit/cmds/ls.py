@@ -2,15 +2,19 @@
 The xgit ls command.
 '''
 from pathlib import Path, PurePosixPath
-from typing import cast
+from typing import TYPE_CHECKING
 
 from xontrib.xgit.context_types import GitContext
 from xontrib.xgit.decorators import command, xgit
-from xontrib.xgit.object_types import GitObject, GitTree
-from xontrib.xgit.entry_types import GitEntry, GitEntryTree, EntryObject
-from xontrib.xgit.types import GitNoRepositoryException, GitNoWorktreeException
+from xontrib.xgit.entry_types import GitEntry, EntryObject
+from xontrib.xgit.types import (
+    GitNoRepositoryException, GitNoWorktreeException,
+)
 from xontrib.xgit.views import View, TableView
 
+if TYPE_CHECKING:
+    from xontrib.xgit.object_types import GitCommit
+
 @command(
     for_value=True,
     export=True,
@@ -27,20 +31,12 @@ def git_ls(path: Path | str = Path('.'), *,
     if not XGIT:
         raise GitNoRepositoryException()
     def do_ls(path: PurePosixPath) -> GitEntry[EntryObject]:
-        parent: GitObject  = XGIT.commit
-        tree = parent.tree
+        commit: GitCommit = XGIT.commit
         if path == PurePosixPath('.'):
-            return tree.get('.')
-        for part in path.parent.parts:
-            if part == ".":
-                continue
-            entry = tree.get(part)
-            if not isinstance(entry, GitEntryTree):
-                raise ValueError(f"{path} is not a directory tree: {type(entry)}")
-            entry = entry.object[part]
-            path = path / part
-            tree = entry.object.as_('tree')
-        tree = cast(GitTree, tree)
+            return commit.tree.get('.')
+        if path.parent == PurePosixPath('.'):
+            return commit.tree.get(path.name)
+        tree = XGIT.repository.tree_at(commit.hash, path.parent)
         return tree.get(path.name)
     try:
         worktree = XGIT.worktree
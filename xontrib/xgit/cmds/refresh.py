@@ -0,0 +1,16 @@
+'''
+The xgit refresh command.
+'''
+import xontrib.xgit.context as ct
+from xontrib.xgit.decorators import command, xgit
+
+@command(
+    export=True,
+    prefix=(xgit, 'refresh'),
+)
+def git_refresh(**_) -> None:
+    """
+    Forget the remembered locations of worktrees, so they are searched
+    for again. Use after creating, moving or removing a repository.
+    """
+    ct._forget_worktrees()
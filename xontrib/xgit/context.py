@@ -19,6 +19,9 @@ classes are complex. It is very easy to end up with circular imports.
 '''
 
 from collections import defaultdict
+from functools import lru_cache
+import os
+from stat import S_ISDIR, S_ISREG
 from collections.abc import Mapping
 from types import MappingProxyType
 from typing import (
@@ -32,7 +35,7 @@ from xonsh.tools import chdir
 from xonsh.lib.pretty import RepresentationPrinter
 from xonsh.events import events
 
-from xontrib.xgit.git_cmd import _GitCmd
+from xontrib.xgit.git_cmd import _GitCmd, _find_worktree_root, _resolve_absolute
 from xontrib.xgit.person import Person
 from xontrib.xgit.types import (
     ObjectId, CommitId, GitObjectReference,
@@ -45,6 +48,7 @@ from xontrib.xgit.types import (
 import xontrib.xgit.ref_types as rt
 import xontrib.xgit.object_types as ot
 from xontrib.xgit.views import JsonDescriber
+from xontrib.xgit.decorators import event_handler
 from xontrib.xgit.entry_types import GitEntryTree
 from xontrib.xgit.context_types import (
     GitContext,
@@ -57,6 +61,131 @@ from xontrib.xgit.utils import path_and_parents, relative_to_home, shorten_branc
 
 ROOT_REPO_PATH = PurePosixPath()
 
+@lru_cache(maxsize=512)
+def _find_worktree(path: str, /) -> tuple[Path, Path, Path]:
+    '''
+    Search the absolute `path` and its parents for a worktree, as
+    described in `GitContext.find_worktree`.
+
+    Only successful searches are remembered; see `_forget_worktrees`.
+    '''
+    return _find_worktree_resolved(os.path.realpath(path))
+
+
+@lru_cache(maxsize=512)
+def _find_worktree_resolved(path: str, /) -> tuple[Path, Path, Path]:
+    '''
+    Search the resolved `path`, then its parents, with one `stat` per
+    directory. Each parent searched is remembered as well, so moving up
+    within a worktree finds it without searching.
+    '''
+    name = os.path.basename(path)
+    if name.endswith('.git') and name != '.git':
+        # This is a repository, not a worktree
+        raise WorktreeNotFoundError(Path(path))
+    if name == '.git':
+        # This is a repository, inside a worktree
+        p = Path(path)
+        return p.parent, p, p
+    gitpath = os.path.join(path, '.git')
+    try:
+        mode = os.stat(gitpath).st_mode
+    except OSError:
+        mode = 0
+    if S_ISDIR(mode):
+        # This is a worktree, with a repository inside
+        p = Path(gitpath)
+        return Path(path), p, p
+    if S_ISREG(mode):
+        # This is a worktree, with a linked repository
+        repo, private = _read_gitdir(Path(gitpath))
+        return Path(path), repo, private
+    parent = os.path.dirname(path)
+    if parent == path:
+        raise WorktreeNotFoundError(Path(path))
+    return _find_worktree_resolved(parent)
+
+
+_RELOCATING_COMMANDS = frozenset({
+    'init', 'clone', 'worktree', 'submodule',
+})
+'''
+The `git` subcommands that can create, move or remove worktrees.
+'''
+
+_GIT_OPTIONS_WITH_VALUE = frozenset({
+    '-C', '-c', '--git-dir', '--work-tree', '--namespace', '--config-env',
+})
+'''
+The global `git` options that take their value as the following word.
+'''
+
+def _git_subcommand(cmd: str) -> str|None:
+    '''
+    The subcommand of a `git` command line, after any global options
+    (e.g. `git -C dir init` runs `init`), or `None` if it is not one.
+    '''
+    words = cmd.split()
+    if not words or words[0] != 'git':
+        return None
+    i = 1
+    while i < len(words) and words[i].startswith('-'):
+        i += 2 if words[i] in _GIT_OPTIONS_WITH_VALUE else 1
+    return words[i] if i < len(words) else None
+
+def _forget_worktrees():
+    '''
+    Forget the remembered locations of worktrees, so they are searched
+    for again.
+    '''
+    _find_worktree.cache_clear()
+    _find_worktree_resolved.cache_clear()
+    _find_worktree_root.cache_clear()
+    _resolve_absolute.cache_clear()
+
+
+@event_handler(events.on_postcommand)
+def _forget_relocated_worktrees(cmd: str, **_):
+    '''
+    After a `git` command that may have moved worktrees, forget where
+    they were. Other commands, including the ones that only change
+    what is checked out, leave the remembered locations alone.
+    '''
+    if _git_subcommand(cmd) in _RELOCATING_COMMANDS:
+        _forget_worktrees()
+
+
+def _read_gitdir(gitdir: Path, /) -> tuple[Path, Path]:
+    '''
+    Read the .git file and return the path to the repository.
+
+    Raises `RepositoryNotFoundError` if the repository is not found
+    or is not a repository.
+
+    PARAMETERS
+    ----------
+    gitdir: Path
+        The path to the .git directory/file.
+    RETURNS
+    -------
+    common: Path
+        The path to the main repository.
+    private: Path
+        The path to the private area for the worktree.
+    '''
+    if gitdir.name == '.git':
+        if gitdir.is_dir():
+            if (gitdir / 'HEAD').exists():
+                return gitdir, gitdir
+        elif gitdir.is_file():
+            with gitdir.open() as f:
+                line = f.readline().strip()
+                if line.startswith('gitdir: '):
+                    for_worktree = (gitdir.parent / line[8:])
+                    return for_worktree.parent.parent, for_worktree
+    raise RepositoryNotFoundError(gitdir)
+
+
 events.doc('on_xgit_repository_change', 'Runs when the current repository changes.')
 events.doc('on_xgit_worktree_change', 'Runs when the current worktree changes.')
 events.doc('on_xgit_branch_change', 'Runs when the current branch changes.')
@@ -153,41 +282,10 @@ class _GitContext(_GitCmd, GitContext):
                 if loc.suffix == '.git':
                     return loc, None
             if (gitpath := (loc / '.git')).exists():
-                return self._read_gitdir(gitpath)
+                return _read_gitdir(gitpath)
         raise RepositoryNotFoundError(path)
 
 
-    def _read_gitdir(self, gitdir: Path, /) -> tuple[Path, Path]:
-        '''
-        Read the .git file and return the path to the repository.
-
-        Raises `RepositoryNotFoundError` if the repository is not found
-        or is not a repository.
-
-        PARAMETERS
-        ----------
-        gitdir: Path
-            The path to the .git directory/file.
-        RETURNS
-        -------
-        common: Path
-            The path to the main repository.
-        private: Path
-            The path to the private area for the worktree.
-        '''
-        if gitdir.name == '.git':
-            if gitdir.is_dir():
-                if (gitdir / 'HEAD').exists():
-                    return gitdir, gitdir
-            elif gitdir.is_file():
-                with gitdir.open() as f:
-                    line = f.readline().strip()
-                    if line.startswith('gitdir: '):
-                        for_worktree = (gitdir.parent / line[8:])
-                        return for_worktree.parent.parent, for_worktree
-        raise RepositoryNotFoundError(gitdir)
-
-
     def find_worktree(self, path: Path, /) -> tuple[Path, Path, Path]:
         '''
         Find the worktree associated with the given path.
@@ -195,7 +293,8 @@ class _GitContext(_GitCmd, GitContext):
         Raises `WorktreeNotFoundError` if the worktree is not found.
 
         This is done by looking for a .git directory in the path or
-        any of its parents.
+        any of its parents. Worktrees found are remembered, so changing
+        directories within a worktree does not search again.
 
         Raises `WorktreeNotFoundError` if the worktree is not found.
 
@@ -212,22 +311,16 @@ class _GitContext(_GitCmd, GitContext):
         private: Path
             The path to the private area for the worktree.
         '''
-        path = Path(path).resolve()
-        for p in path_and_parents(path):
-            if p.suffix == ".git":
-                # This is a repository, not a worktree
-                raise WorktreeNotFoundError(path)
-            if p.name == ".git":
-                # This is a repository, inside a worktree
-                return p.parent, p, p
-            if (gitpath := (p / ".git")).is_dir():
-                # This is a worktree, with a repository inside
-                return p, gitpath, gitpath
-            if gitpath.is_file():
-                # This is a worktree, with a linked repository
-                repo, private = self._read_gitdir(gitpath)
-                return p, repo, private
-        raise WorktreeNotFoundError(path)
+        key = os.path.abspath(path)
+        try:
+            found = _find_worktree(key)
+            if not (found[0] / '.git').exists():
+                # Removed since we found it; forget what we remembered.
+                _forget_worktrees()
+                found = _find_worktree(key)
+        except WorktreeNotFoundError:
+            raise WorktreeNotFoundError(Path(os.path.realpath(key))) from None
+        return found
 
     def open_worktree(self, location: Path|str, /, *,
                     repository: Optional[GitRepository|str|Path]=None,
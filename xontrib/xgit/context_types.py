@@ -25,7 +25,7 @@ from xonsh.built_ins import XonshSession
 
 from xontrib.xgit.types import (
     GitObjectReference, GitObjectType, GitException,
-    ObjectId, GitRepositoryId, GitReferenceType,
+    ObjectId, CommitId, GitRepositoryId, GitReferenceType,
 )
 from xontrib.xgit.views.json_types import Jsonable
 import xontrib.xgit.person as people
@@ -142,6 +142,34 @@ class GitRepository(Jsonable, gc.GitCmd, Protocol):
         '''
         ...
 
+    @abstractmethod
+    def load_objects(self, /, *hashes: 'ot.Objectish') -> list['ot.GitObject']:
+        '''
+        Get several objects, loaded and ready to use, with one round trip
+        to git for their types and one for their contents, rather than
+        one or two per object.
+        '''
+        ...
+
+    @abstractmethod
+    def prime_tree(self, tree: 'ot.Treeish', /) -> 'ot.GitTree':
+        '''
+        Load a tree and every tree below it, fetching each level of
+        the hierarchy from git in one round trip. Use before walking
+        a whole tree.
+        '''
+        ...
+
+    @abstractmethod
+    def tree_at(self, commit: CommitId, path: PurePosixPath, /) -> 'ot.GitTree':
+        '''
+        Get the tree at `path` in `commit`, looking it up directly rather
+        than loading every tree on the way down to it.
+
+        Raises `ValueError` if there is no directory tree at `path`.
+        '''
+        ...
+
     @abstractmethod
     def get_ref(self, ref: 'rt.RefSpec|None' =None) -> 'rt.GitRef|None':
         '''
@@ -101,6 +101,8 @@ class ConversionManager:
 
 
 class ArgTransform:
+    __slots__ = ('__declared', '__name', '__source', '__target')
+
     __name: str
     @property
     def name(self) -> str:
@@ -156,6 +158,7 @@ class TypeTransform(ArgTransform):
     '''
     A transformation that converts the argument into a different type.
     '''
+    __slots__ = ('__completer', '__converter')
 
     def __init__(self, name: str,
                  declared: type,
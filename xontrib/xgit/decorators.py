@@ -56,6 +56,13 @@ def _export(cmd: Any | str, name: Optional[str] = None):
     _exports[name] = cmd
     return cmd
 
+def _export_names(*names: str):
+    """
+    Mark names for export with no initial value, in a single call.
+    These are variables to be set later, in the xonsh context.
+    """
+    _exports.update(dict.fromkeys(names))
+
 def context(xsh: Optional[XonshSession] = GLOBAL_XSH) -> GitContext:
     if xsh is None:
         raise GitError('No xonsh session supplied.')
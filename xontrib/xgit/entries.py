@@ -15,7 +15,7 @@ BEWARE: The interrelationships between the entry, object, and context
 classes are complex. It is very easy to end up with circular imports.
 """
 
-from types import MappingProxyType
+from sys import intern
 from typing import Optional, TypeAlias, cast
 from collections.abc import ItemsView, ValuesView, Mapping
 from pathlib import PurePosixPath
@@ -24,7 +24,6 @@ from pathlib import PurePosixPath
 from xonsh.lib.pretty import RepresentationPrinter
 from xontrib.xgit.context_types import GitRepository
 from xontrib.xgit.identity_set import IdentitySet
-import xontrib.xgit.objects as xo
 from xontrib.xgit.types import (
     GitEntryMode, ObjectId,
 )
@@ -37,6 +36,24 @@ import xontrib.xgit.object_types as ot
 
 EntryObject: TypeAlias = 'ot.GitTree | ot.GitBlob | ot.GitCommit'
 
+_MODE_PREFIX: dict[str, str] = {
+    "120000": "L",
+    "160000": "S",
+    "100755": "X",
+}
+'''
+The display prefix for entry modes other than trees and plain files.
+'''
+
+_MODE_INTERN: dict[str, str] = {
+    m: intern(m)
+    for m in ("100644", "100755", "120000", "160000", "040000")
+}
+'''
+Shared mode strings, so the many entries of a large tree don't each
+hold their own copy of one of a handful of values.
+'''
+
 class _GitEntry(GitEntry[OBJ]):
     """
     An entry in a git tree. In addition to referencing a `GitObject`,
@@ -47,7 +64,7 @@ class _GitEntry(GitEntry[OBJ]):
     __name: str
     __object: OBJ
     __mode: GitEntryMode
-    __path: PurePosixPath
+    __path: PurePosixPath|str
     __parent_object: Optional[ParentObject]
     __parent: Optional['GitEntryTree']
     __repository: GitRepository
@@ -72,21 +89,13 @@ class _GitEntry(GitEntry[OBJ]):
     def object(self) -> OBJ:
         return self.__object
 
+    __prefix: str
     @property
     def prefix(self):
         """
         Return the prefix for the entry type.
         """
-        if self.type == "tree":
-            return "D"
-        elif self.mode == "120000":
-            return "L"
-        elif self.mode == "160000":
-            return "S"
-        elif self.mode == "100755":
-            return "X"
-        else:
-            return"-"
+        return self.__prefix
 
     @property
     def name(self):
@@ -100,92 +109,117 @@ class _GitEntry(GitEntry[OBJ]):
     def parent(self) -> 'GitEntryTree | None':
         if self.__parent is not None:
             return self.__parent
-        if self.__parent_object is None:
-            return None
         parent = self.__parent_object
-        if parent.type != "tree":
+        if parent is None or parent.type != "tree":
             return None
-        parent = cast(xo.GitTree, parent)
-        return cast(GitEntryTree, parent.hashes[self.hash])
+        # The entry for the containing tree is that tree's own '.' entry,
+        # which is fixed for the life of the tree, so remember it.
+        self.__parent = cast(GitEntryTree, cast(ot.GitTree, parent).get('.'))
+        return self.__parent
         #entry = xo._git_entry(parent, self._name, self._mode, self.type, self.size,
 
     @property
     def repository(self):
         return self.__repository
 
+    __entry: str
     @property
     def entry(self):
-        rw = self.prefix
-        return f"{rw} {self.type} {self.hash}\t{self.name}"
+        return self.__entry
 
+    __entry_long: str|None
     @property
     def entry_long(self):
-        size = str(self.size) if self.size >= 0 else '-'
-        rw = self.prefix
-        return f"{rw} {self.type} {self.hash} {size!s:>8s}\t{self.name}"
+        # Computed on first use, as the size may require loading the object.
+        if (entry_long := self.__entry_long) is None:
+            size = self.size
+            size_str = str(size) if size >= 0 else '-'
+            entry_long = (f"{self.prefix} {self.type} {self.hash} "
+                          f"{size_str:>8s}\t{self.name}")
+            self.__entry_long = entry_long
+        return entry_long
 
     @property
     def path(self) -> PurePosixPath:
-        return self.__path
+        # Entries are made in bulk, and few are asked for their path, so
+        # it is kept as a str until it is.
+        if isinstance(path := self.__path, str):
+            path = self.__path = PurePosixPath(path)
+        return path
 
     def __init__(self,
                  object: OBJ,
                  name: str,
                  mode: GitEntryMode,
                  repository: GitRepository,
-                 path: PurePosixPath,
+                 path: PurePosixPath|str,
                  parent_object: Optional['ParentObject|ObjectId']=None,
                  parent: Optional['GitEntryTree']=None,
             ):
         self.__object = object
         self.__name = name
-        self.__mode = mode
+        self.__mode = cast(GitEntryMode, _MODE_INTERN.get(mode) or intern(mode))
         self.__path = path
+        # Type and mode are fixed, so the prefix can be computed up front.
+        self.__prefix = (
+            "D" if object.type == "tree"
+            else _MODE_PREFIX.get(mode, "-")
+        )
         self.__repository = repository
-        po = None
-        if isinstance(parent_object, str):
-            po = cast(ParentObject, repository.get_object(parent_object))
-        if parent is not None and parent_object is None:
-            po = parent.object
+        match parent_object:
+            case None:
+                po = parent.object if parent is not None else None
+            case str():
+                po = cast(ParentObject, repository.get_object(parent_object))
+            case _:
+                po = parent_object
         self.__parent_object = po
         self.__parent = parent
         self.__hashes = {}
+        self.__entry = f"{self.prefix} {object.type} {object.hash}\t{name}"
+        self.__entry_long = None
 
     #def __hasattr__(self, name):
     #    return hasattr(self._object, name)
 
 
     def __str__(self):
-        return f"{self.entry_long} {self.name}"
+        return f"{self.entry_long} {self.__name}"
 
     def __repr__(self):
-        return f"GitTreeEntry({self.name!r}, {self.entry_long!r})"
+        return f"GitTreeEntry({self.__name!r}, {self.entry_long!r})"
 
     def __format__(self, fmt: str):
-        return f"{self.entry_long.__format__(fmt)}"
+        return self.entry_long.__format__(fmt)
 
     def _repr_pretty_(self, p: RepresentationPrinter, cycle: bool):
         if cycle:
             p.text("GitTreeEntry(...)")
         else:
+            # Look up the parent once; it can involve a search of the parent tree.
+            parent = self.parent
+            parent_hash = parent.hash if parent else None
+            breakable = p.breakable
+            text = p.text
             with p.group(4, "GitTreeEntry(", ')'):
-                p.breakable()
+                breakable()
                 p.pretty(self.__object)
-                p.text(',')
-                p.breakable()
-                p.text(f'mode={self.mode!r},')
-                p.breakable()
-                p.text(f'name={self.name!r},')
-                p.breakable()
-                p.text(f'parent={self.parent.hash if self.parent else None!r},')
-                p.breakable()
-                p.text(f'path={self.path!r}')
+                text(',')
+                breakable()
+                text(f'mode={self.__mode!r},')
+                breakable()
+                text(f'name={self.__name!r},')
+                breakable()
+                text(f'parent={parent_hash!r},')
+                breakable()
+                text(f'path={self.path!r}')
 
 
 class _GitEntryTree(_GitEntry[ot.GitTree], GitEntryTree):
     @property
     def hashes(self) -> Mapping[ObjectId, IdentitySet[GitEntry, int]]:
-        return MappingProxyType(self.object.hashes)
+        # Already a read-only view, created once by the tree.
+        return self.object.hashes
 
     def __getitem__(self, name):
     #                   -> Self | Any | GitEntryTree | GitEntry[GitBlob | GitCommit ...:
@@ -9,7 +9,9 @@ Accessing the entries from a `GitTree` will return the concrete,
 properly registered, and this should be the only way to get them.
 
 These are `Protocol` classes, so they can be used as a type hint for
-duck typing.
+duck typing. They are not `runtime_checkable`, as protocol `isinstance`
+checks are far too slow for use while walking trees; test the `type`
+instead.
 
 BEWARE: The interrelationships between the entry, object, and context
 classes are complex. It is very easy to end up with circular imports.
@@ -17,7 +19,7 @@ classes are complex. It is very easy to end up with circular imports.
 
 from abc import abstractmethod
 from typing import (
-    Protocol, Optional, TypeVar, Generic, TypeAlias, runtime_checkable,
+    Protocol, Optional, TypeVar, Generic, TypeAlias,
     TYPE_CHECKING,
 )
 from pathlib import PurePosixPath
@@ -32,7 +34,6 @@ ParentObject: TypeAlias = 'ot.GitTree | ot.GitCommit | ot.GitTagObject'
 EntryObject: TypeAlias = 'ot.GitTree | ot.GitBlob | ot.GitCommit'
 OBJ = TypeVar('OBJ', bound='EntryObject', covariant=True)
 
-@runtime_checkable
 class GitEntry(Generic[OBJ], Protocol):
     """
     An entry in a git tree. In addition to referencing a `GitObject`,
@@ -58,6 +59,9 @@ class GitEntry(Generic[OBJ], Protocol):
     def name(self) -> str: ...
     @property
     @abstractmethod
+    def prefix(self) -> str: ...
+    @property
+    @abstractmethod
     def entry(self) -> str: ...
     @property
     @abstractmethod
@@ -79,7 +83,6 @@ class GitEntry(Generic[OBJ], Protocol):
     def path(self) -> PurePosixPath: ...
 
 
-@runtime_checkable
 class GitEntryTree(GitEntry, Protocol):
     __path: Optional[PurePosixPath] = None
     @abstractmethod
@@ -91,4 +94,3 @@ class GitEntryBlob(GitEntry):
 class GitEntryCommit(GitEntry):
     ...
 
-
@@ -3,11 +3,14 @@ A mixin class for git commands on a repository or worktree.
 '''
 
 from abc import abstractmethod
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 from subprocess import (
-    run, PIPE, Popen, CompletedProcess,
+    run, PIPE, Popen, CompletedProcess, CalledProcessError,
 )
 import shutil
+from threading import Lock, Thread
 from typing import (
     Optional, runtime_checkable, Protocol,
     IO, cast,
@@ -15,7 +18,9 @@ from typing import (
 )
 from collections.abc import Sequence, Iterator
 
-from xontrib.xgit.types import ObjectId, CommitId, GitException
+from xontrib.xgit.types import (
+    ObjectId, CommitId, GitException, GitObjectType, _OBJECT_TYPES,
+)
 
 if TYPE_CHECKING:
     import xontrib.xgit.context_types as ct
@@ -239,6 +244,31 @@ class GitCmd(Protocol):
             The output of the command. .read() returns a bytes object.
         '''
 
+    @abstractmethod
+    def git_bytes(self, subcmd: str, *args, **kwargs) -> bytes:
+        '''
+        Run a git command and return its entire output at once.
+
+        For callers that want all the output anyway, this avoids the
+        per-line or per-read overhead of the streaming forms, and the
+        process is waited for.
+
+        PARAMETERS
+        ----------
+        subcmd: str
+            The git subcommand to run.
+        args: Any
+            The arguments to the command.
+        kwargs: Any
+            Additional arguments to pass to `subprocess.run`.
+
+        RETURNS
+        -------
+        bytes
+            The output of the command.
+        '''
+        ...
+
     @abstractmethod
     def rev_parse(self, param: str, /) -> ObjectId:
         '''
@@ -275,6 +305,77 @@ class GitCmd(Protocol):
         '''
         ...
 
+    @abstractmethod
+    def cat_file_check(self, oid: str, /) -> tuple[ObjectId, GitObjectType, int]:
+        '''
+        Get the id, type, and size of an object, without its content.
+
+        PARAMETERS
+        ----------
+        oid: str
+            The object to look up.
+
+        RETURNS
+        -------
+        tuple[ObjectId, GitObjectType, int]
+            The full id, type, and size of the object.
+        '''
+        ...
+
+    @abstractmethod
+    def cat_file_batch(self, oid: str, /) -> bytes:
+        '''
+        Get the raw content of an object.
+
+        PARAMETERS
+        ----------
+        oid: str
+            The object to look up.
+
+        RETURNS
+        -------
+        bytes
+            The content of the object, as `git cat-file <type> <oid>`
+            would return it.
+        '''
+        ...
+
+    @abstractmethod
+    def cat_file_check_many(self, /, *oids: str
+                            ) -> list[tuple[ObjectId, GitObjectType, int]]:
+        '''
+        Get the id, type, and size of several objects in one round trip.
+
+        PARAMETERS
+        ----------
+        oids: str
+            The objects to look up.
+
+        RETURNS
+        -------
+        list[tuple[ObjectId, GitObjectType, int]]
+            The full id, type, and size of each object, in the order given.
+        '''
+        ...
+
+    @abstractmethod
+    def cat_file_batch_many(self, /, *oids: str
+                            ) -> list[tuple[ObjectId, GitObjectType, bytes]]:
+        '''
+        Get the raw content of several objects in one round trip.
+
+        PARAMETERS
+        ----------
+        oids: str
+            The objects to look up.
+
+        RETURNS
+        -------
+        list[tuple[ObjectId, GitObjectType, bytes]]
+            The full id, type, and content of each object, in the order given.
+        '''
+        ...
+
     @abstractmethod
     def worktree_locations(self, path: Path) -> tuple[Path, Path, Path, ObjectId]:
         '''
@@ -307,6 +408,58 @@ class GitCmd(Protocol):
         '''
         ...
 
+_PIPE_BUFSIZE = 1 << 20
+'''
+Buffer size for reading streamed output from git, to cut down on
+read calls for large outputs such as `git log` or `git ls-tree -r`.
+'''
+
+@lru_cache(maxsize=256)
+def _find_worktree_root(path: str) -> Path|None:
+    '''
+    Find the nearest directory at or above `path` holding a `.git`
+    directory or file.
+
+    Worktree roots don't move during a session, so the walk up the
+    filesystem is only done once per (resolved) path.
+    '''
+    start = Path(path)
+    for p in (start, *start.parents):
+        if (p / ".git").exists():
+            return p
+    return None
+
+@lru_cache(maxsize=1)
+def _find_git() -> Path:
+    '''
+    Locate the `git` executable on `$PATH`.
+
+    Searching `$PATH` costs a `stat` per entry, so it is done once
+    rather than for every `_GitCmd`.
+    '''
+    git = shutil.which("git")
+    if git is None:
+        raise ValueError("git command not found")
+    return Path(git)
+
+def _resolve(path: Path) -> Path:
+    '''
+    `Path.resolve()`, remembered per absolute path. A relative path
+    depends on the current directory, so is resolved afresh each time.
+    '''
+    if not path.is_absolute():
+        return path.resolve()
+    return _resolve_absolute(path)
+
+@lru_cache(maxsize=256)
+def _resolve_absolute(path: Path) -> Path:
+    '''
+    `Path.resolve()` for an absolute path, remembered until the worktree
+    locations are forgotten (symlinks may have been retargeted).
+    '''
+    return path.resolve()
+
+
 class _GitCmd:
     """
     A context for a git command.
@@ -321,25 +474,35 @@ class _GitCmd:
     def context(self) -> 'ct.GitContext':
         return self.__context
 
+    __cat_file: Popen|None = None
+    '''
+    A persistent `git cat-file --batch` process, started on first use.
+    '''
+    __cat_file_check: Popen|None = None
+    '''
+    A persistent `git cat-file --batch-check` process, started on first use.
+    '''
+    __cat_file_lock: Lock
+
     def __get_path(self, path: Path|str|None) -> Path:
         '''
         Get the working directory path for the command.
+
+        This is only used as the `cwd` of a subprocess, so it is left
+        for the OS to resolve any symlinks rather than calling
+        `Path.resolve()` (a `stat` per component) on every command.
         '''
+        base = self.__path or Path.cwd()
         if path is None:
-            path = self.__path or Path.cwd()
-        else:
-            s_path = self.__path or Path.cwd()
-            path = s_path / path
-        return path.resolve()
+            return base
+        return base / path
 
     def __init__(self, path: Optional[Path]=None):
         if path is not None:
-            path = path.resolve()
+            path = _resolve(path)
         self.__path = path
-        git = shutil.which("git")
-        if git is None:
-            raise ValueError("git command not found")
-        self.__git = Path(git)
+        self.__git = _find_git()
+        self.__cat_file_lock = Lock()
 
     def run(self, cmd: str|Path, *args,
             cwd: Optional[Path]=None,
@@ -386,8 +549,10 @@ class _GitCmd:
         RETURNS
         -------
         Iterator[str]
-            The output of the command.
+            The output of the command. With `text=False`, the lines
+            are `bytes`, skipping the decode.
         '''
+        kwargs.setdefault('bufsize', _PIPE_BUFSIZE)
         proc = Popen([cmd, *(str(a) for a in args)],
             stdout=stdout,
             text=text,
@@ -396,9 +561,20 @@ class _GitCmd:
         stream = proc.stdout
         if stream is None:
             raise ValueError("No stream")
-        for line in stream:
-            yield line.rstrip()
-        proc.wait()
+        # With text=False, lines are bytes and are yielded undecoded.
+        nl = '\n' if text else b'\n'
+        done = False
+        try:
+            for line in stream:
+                # Only the line terminator; callers strip further if they need to.
+                yield line[:-1] if line[-1:] == nl else line
+            done = True
+        finally:
+            # If the caller stopped early, don't leave git running.
+            stream.close()
+            if not done and proc.poll() is None:
+                proc.terminate()
+            proc.wait()
         if code := proc.returncode:
             raise GitException(f"Command failed: {cmd} {args} {code}")
 
@@ -427,6 +603,7 @@ class _GitCmd:
         bytes
 
         '''
+        kwargs.setdefault('bufsize', _PIPE_BUFSIZE)
         proc = Popen([cmd, *(str(a) for a in args)],
             stdout=PIPE,
             text=True,
@@ -463,6 +640,7 @@ class _GitCmd:
         bytes
 
         '''
+        kwargs.setdefault('bufsize', _PIPE_BUFSIZE)
         proc = Popen([cmd, *(str(a) for a in args)],
             stdout=PIPE,
             text=False,
@@ -526,6 +704,15 @@ class _GitCmd:
             text=text,
             **kwargs)
 
+    def git_bytes(self, subcmd: str, *args,
+                check: bool=True,
+                **kwargs) -> bytes:
+        return self.run(str(self.__git), subcmd, *args,
+            stdout=PIPE,
+            text=False,
+            check=check,
+            **kwargs).stdout
+
     def rev_parse(self, param: str, /) -> CommitId:
         return CommitId(ObjectId(self.rev_parse_n(param)[0]))
 
@@ -533,37 +720,247 @@ class _GitCmd:
         """
         Use `git rev-parse` to get multiple parameters at once.
         """
+        if len(params) == 1:
+            # The common case; usually answered without starting git at all.
+            return [self.__rev_parse_one(params[0])]
         val = self.git_list("rev-parse", *params)
         if val:
             result = val
         else:
-            # Try running them individually.
-            result = [self.git_string("rev-parse", param) for param in params]
+            # Try them individually, through the persistent cat-file process
+            # where possible rather than starting git once per parameter.
+            result = [self.__rev_parse_one(param) for param in params]
         return result
 
+    def __rev_parse_one(self, param: str) -> str:
+        '''
+        Resolve a single revision, falling back to `git rev-parse`
+        for anything `git cat-file` can't resolve (e.g. options).
+
+        The cat-file process stays in the directory it was started in, so
+        it is only used when this has a fixed path. Without one, commands
+        run in the current directory, which may since have changed.
+        '''
+        if self.__path is not None and not param.startswith('-'):
+            with suppress(GitException):
+                return self.cat_file_check(param)[0]
+        try:
+            return self.git_string("rev-parse", param)
+        except CalledProcessError as ex:
+            raise GitException(
+                f"Command failed: {self.__git} rev-parse {param} {ex.returncode}"
+            ) from ex
+
 
-    def worktree_locations(self, path: Path) -> tuple[Path, Path, Path, CommitId]:
-        path = path.resolve()
-        for p in (path, *path.parents):
-            git_dir = p / ".git"
-            if git_dir.is_dir():
-                commit = self.rev_parse("HEAD")
-                return path, path, git_dir, commit
-            git_file = path / ".git"
-
-            if git_file.is_file():
-                worktree, private, common, commit = self.rev_parse_n(
-                    "--show-toplevel",
-                    "--absolute-git-path",
-                    "--git-common-dir", "HEAD"
+    def __cat_file_popen(self, mode: str) -> Popen:
+        return Popen([str(self.__git), "cat-file", mode],
+                     stdin=PIPE,
+                     stdout=PIPE,
+                     cwd=self.__get_path(None))
+
+    @staticmethod
+    def __cat_file_header(proc: Popen, oid: str) -> tuple[ObjectId, GitObjectType, int]:
+        '''
+        Send a request to a `cat-file` process and read the header line.
+        '''
+        stdin, stdout = proc.stdin, proc.stdout
+        if stdin is None or stdout is None:
+            raise ValueError("No stream")
+        _GitCmd.__check_spec(oid)
+        stdin.write(f"{oid}\n".encode())
+        stdin.flush()
+        reply = _GitCmd.__cat_file_reply(proc, stdout.readline(), oid)
+        if reply is None:
+            raise GitException(f"Object not found: {oid}")
+        return reply
+
+    @staticmethod
+    def __check_spec(oid: str) -> None:
+        '''
+        Reject a spec that would be read as more than one request, and so
+        leave the replies out of step with the requests.
+        '''
+        if '\n' in oid:
+            raise GitException(f"Invalid object name: {oid!r}")
+
+    @staticmethod
+    def __cat_file_reply(proc: Popen, header: bytes, oid: str
+                         ) -> tuple[ObjectId, GitObjectType, int]|None:
+        '''
+        Parse the header line `cat-file` replies with: `<hash> <type> <size>`,
+        or `<spec> missing` (or `ambiguous`) for an object it can't find,
+        for which `None` is returned. The spec may itself contain spaces.
+
+        Anything else leaves the process's output in an unknown state, so
+        the process is stopped, to be restarted by the next request.
+        '''
+        header = header.rstrip(b'\n')
+        if header.endswith((b' missing', b' ambiguous')):
+            return None
+        fields = header.rsplit(b' ', 2)
+        if len(fields) == 3:
+            hash, type, size = fields
+            object_type = _OBJECT_TYPES.get(type)
+            if object_type is not None and size.isdigit():
+                return ObjectId(hash.decode()), object_type, int(size)
+        proc.kill()
+        proc.wait()
+        raise GitException(f"Unexpected reply from git cat-file for {oid}: {header!r}")
+
+    def cat_file_check(self, oid: str, /) -> tuple[ObjectId, GitObjectType, int]:
+        '''
+        Get the id, type, and size of an object, without its content.
+
+        This uses a persistent `git cat-file --batch-check` process, so
+        repeated lookups don't pay for starting `git` each time.
+        '''
+        with self.__cat_file_lock:
+            proc = self.__cat_file_check
+            if proc is None or proc.poll() is not None:
+                proc = self.__cat_file_popen(
+                    "--batch-check=%(objectname) %(objecttype) %(objectsize)"
+                )
+                self.__cat_file_check = proc
+            return self.__cat_file_header(proc, oid)
+
+    def cat_file_batch(self, oid: str, /) -> bytes:
+        '''
+        Get the raw content of an object.
+
+        This uses a persistent `git cat-file --batch` process, so
+        repeated lookups don't pay for starting `git` each time.
+        '''
+        with self.__cat_file_lock:
+            proc = self.__cat_file
+            if proc is None or proc.poll() is not None:
+                proc = self.__cat_file_popen(
+                    "--batch=%(objectname) %(objecttype) %(objectsize)"
+                )
+                self.__cat_file = proc
+            _, _, size = self.__cat_file_header(proc, oid)
+            stdout = cast(IO[bytes], proc.stdout)
+            # The content is followed by a newline.
+            return stdout.read(size + 1)[:size]
+
+    @staticmethod
+    def __cat_file_pipeline(proc: Popen, oids: Sequence[str], content: bool
+                            ) -> list[tuple[ObjectId, GitObjectType, int, bytes]]:
+        '''
+        Send all the requests to a `cat-file` process before reading any of
+        the responses, which come back in the same order.
+
+        The requests are written from another thread; otherwise `git` could
+        fill the output pipe while we are still writing, and both would wait.
+        Every response is read, even after a missing object, so the process
+        is left ready for the next request.
+        '''
+        stdin, stdout = proc.stdin, proc.stdout
+        if stdin is None or stdout is None:
+            raise ValueError("No stream")
+        for oid in oids:
+            _GitCmd.__check_spec(oid)
+        def write():
+            # The pipe is closed if the reader gives up on the process.
+            with suppress(OSError):
+                stdin.write(''.join(f"{oid}\n" for oid in oids).encode())
+                stdin.flush()
+        writer = Thread(target=write, daemon=True)
+        writer.start()
+        results: list[tuple[ObjectId, GitObjectType, int, bytes]] = []
+        missing: list[str] = []
+        readline, read = stdout.readline, stdout.read
+        parse = _GitCmd.__cat_file_reply
+        try:
+            for oid in oids:
+                reply = parse(proc, readline(), oid)
+                if reply is None:
+                    missing.append(oid)
+                    continue
+                hash, type, size = reply
+                data = read(size + 1)[:-1] if content else b''
+                results.append((hash, type, size, data))
+        finally:
+            writer.join()
+        if missing:
+            raise GitException(f"Objects not found: {', '.join(missing)}")
+        return results
+
+    def cat_file_check_many(self, /, *oids: str
+                            ) -> list[tuple[ObjectId, GitObjectType, int]]:
+        '''
+        Get the id, type, and size of several objects, pipelining the
+        requests to the persistent `git cat-file --batch-check` process.
+        '''
+        if not oids:
+            return []
+        with self.__cat_file_lock:
+            proc = self.__cat_file_check
+            if proc is None or proc.poll() is not None:
+                proc = self.__cat_file_popen(
+                    "--batch-check=%(objectname) %(objecttype) %(objectsize)"
                 )
-                return (
-                    Path(worktree),
-                    Path(private),
-                    Path(common),
-                    CommitId(ObjectId(commit))
+                self.__cat_file_check = proc
+            replies = self.__cat_file_pipeline(proc, oids, False)
+            return [(hash, type, size) for hash, type, size, _ in replies]
+
+    def cat_file_batch_many(self, /, *oids: str
+                            ) -> list[tuple[ObjectId, GitObjectType, bytes]]:
+        '''
+        Get the raw content of several objects, pipelining the requests
+        to the persistent `git cat-file --batch` process.
+        '''
+        if not oids:
+            return []
+        with self.__cat_file_lock:
+            proc = self.__cat_file
+            if proc is None or proc.poll() is not None:
+                proc = self.__cat_file_popen(
+                    "--batch=%(objectname) %(objecttype) %(objectsize)"
                 )
-        raise GitException(f"   Not a git repository: {path}")
+                self.__cat_file = proc
+            replies = self.__cat_file_pipeline(proc, oids, True)
+            return [(hash, type, data) for hash, type, _, data in replies]
+
+    def close(self):
+        '''
+        Shut down any persistent `git cat-file` processes.
+        '''
+        with self.__cat_file_lock:
+            for proc in (self.__cat_file, self.__cat_file_check):
+                if proc is not None:
+                    if proc.stdin is not None:
+                        proc.stdin.close()
+                    proc.wait()
+            self.__cat_file = None
+            self.__cat_file_check = None
+
+    def __del__(self):
+        # May be run during interpreter shutdown, or on a partly
+        # initialized object.
+        with suppress(Exception):
+            self.close()
+
+
+    def worktree_locations(self, path: Path) -> tuple[Path, Path, Path, CommitId]:
+        path = _resolve(path)
+        root = _find_worktree_root(str(path))
+        if root is None:
+            raise GitException(f"   Not a git repository: {path}")
+        # One batched call, run in the worktree itself, not our own directory.
+        # The commit is not cached, as HEAD moves.
+        worktree, private, common, commit = self.git_list(
+            "rev-parse",
+            "--show-toplevel",
+            "--absolute-git-dir",
+            "--git-common-dir", "HEAD",
+            cwd=root,
+        )
+        return (
+            Path(worktree),
+            Path(private),
+            (root / common).resolve(),
+            CommitId(ObjectId(commit))
+        )
 
 
     def symbolic_ref(self, ref: str) -> str:
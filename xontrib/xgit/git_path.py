@@ -74,9 +74,8 @@ class GitPath(PurePath):
         return str(self.__object)
 
     def __bytes__(self):
-        t = self.__object.type
         repo = self.__base.repository
-        return bytes(repo.git_binary('cat-file', t, self.__object.hash).read())
+        return repo.cat_file_batch(self.__object.hash)
 
     def __eq__(self, other):
         if isinstance(other, GitPath):
@@ -3,8 +3,9 @@ Utilities for invoking commands based on their signatures.
 '''
 
 from abc import abstractmethod
+from collections import deque
 from collections.abc import Sequence
-from itertools import chain
+from functools import lru_cache
 import sys
 from types import MappingProxyType
 from typing import (
@@ -48,11 +49,138 @@ class ArgumentError(GitValueError):
         super().__init__(message)
         self.message = message
 
+_U_TABLE = str.maketrans('-', '_')
+_H_TABLE = str.maketrans('_', '-')
+
+@lru_cache(maxsize=512)
 def _u(s: str) -> str:
-    return s.replace('-', '_')
+    return s.translate(_U_TABLE)
 
+@lru_cache(maxsize=512)
 def _h(s: str) -> str:
-    return s.replace('_', '-')
+    return s.translate(_H_TABLE)
+
+FlagConsumer = Callable[[Any, deque[Any], dict[str, Any]], None]
+'''
+Consumes a flag's value(s), if any, from the remaining arguments.
+Called with the flag as written, the remaining arguments, and the
+keyword dictionary to store to.
+'''
+
+def _take_values(args: deque[Any], to: list[Any], /):
+    '''
+    Move arguments from the front of `args` to `to`, up to the next flag.
+    '''
+    popleft = args.popleft
+    append = to.append
+    while args:
+        nxt = args[0]
+        if isinstance(nxt, str) and nxt[:1] == '-':
+            return
+        append(popleft())
+
+def _flag_consumers(n: KeywordSpec, /) -> tuple[FlagConsumer, FlagConsumer]:
+    '''
+    Build the consumers for a flag spec, as given and as negated with `--no-`,
+    so the spec need only be interpreted once rather than on every use.
+    '''
+    def invalid(arg, args, to):
+        raise ValueError(f"Invalid flag usage: {arg} {n!r}")
+    match n:
+        case bool(b), str(k):
+            def consume(arg, args, to):
+                to[k] = b
+            def negated(arg, args, to):
+                to[k] = not b
+            return consume, negated
+        case 0, str(k):
+            def consume(arg, args, to):
+                to[k] = arg
+            return consume, consume
+        case 1, str(k):
+            def consume(arg, args, to):
+                to[k] = args.popleft()
+            return consume, invalid
+        case '+', str(k):
+            def consume(arg, args, to):
+                if len(args) == 0:
+                    raise ArgumentError(f"Missing argument for {arg}")
+                argl1 = [args.popleft()]
+                _take_values(args, argl1)
+                to[k] = argl1
+            return consume, invalid
+        case '*', str(k):
+            def consume(arg, args, to):
+                argl2 = []
+                _take_values(args, argl2)
+                to[k] = argl2
+            return consume, invalid
+    return invalid, invalid
+
+
+def _signature_flags(sig: Signature, explicit: KeywordSpecs, /) -> KeywordSpecs:
+    '''
+    Augment the explicitly-supplied flags with those implied by
+    the command's signature, in a single pass over its parameters.
+    The explicit flags are left unmodified.
+    '''
+    flags = dict(explicit)
+    for p in sig.parameters.values():
+        name = p.name
+        if name in flags:
+            continue
+        kind = p.kind
+        # bool can't be subclassed, so identity is the whole test.
+        if p.annotation is bool:
+            flags[_h(name)] = (True, name)
+        elif kind is Parameter.POSITIONAL_OR_KEYWORD or kind is Parameter.KEYWORD_ONLY:
+            flags[_h(name)] = (1, name)
+        elif kind is Parameter.VAR_POSITIONAL:
+            flags[_h(name)] = ('*', name)
+    return flags
+
+
+def _copy_split(s: ArgSplit, /) -> ArgSplit:
+    '''
+    Copy a remembered `ArgSplit`, so callers are free to modify
+    the result, including any lists of flag values.
+    '''
+    return ArgSplit(
+        list(s.args),
+        list(s.extra_args),
+        {k: list(v) if type(v) is list else v for k, v in s.kwargs.items()},
+        dict(s.extra_kwargs),
+    )
+
+
+def _parse_no_flags(arglist: Sequence[Any], /) -> ArgSplit:
+    '''
+    Parse the arguments for a command that recognizes no flags. Every
+    flag is an extra keyword, so no flag can consume the arguments that
+    follow it.
+    '''
+    s = ArgSplit([], [], {}, {})
+    positional = s.args
+    extra_kwargs = s.extra_kwargs
+    for i, arg in enumerate(arglist):
+        if not isinstance(arg, str) or arg[:1] != '-' or arg == '-':
+            positional.append(arg)
+        elif arg[1:2] != '-':
+            for ch in arg[1:]:
+                extra_kwargs[ch] = True
+        elif arg == '--':
+            s.extra_args.extend(arglist[i+1:])
+            break
+        else:
+            k, sep, v = arg[2:].partition("=")
+            if sep:
+                extra_kwargs[k] = v
+            elif k[:3] == "no-":
+                extra_kwargs[_u(k[3:])] = False
+            else:
+                extra_kwargs[_u(k)] = True
+    return s
+
 
 class Invoker:
     __name__: str
@@ -78,6 +206,9 @@ class Invoker:
         self.__doc__ = cmd.__doc__ or self.__doc__ or ''
         self.__module__ = cmd.__module__
         self.__annotations__ = cmd.__annotations__
+        # The function is fixed, so its signature is too; every call needs it.
+        self.__signature = Signature.from_callable(cmd)
+        self.__signature__ = self.__signature
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """
@@ -87,15 +218,14 @@ class Invoker:
         try:
             return self.__function(*args, **kwargs)
         except TypeError as e:
-            if (
-                e.__traceback__ and
-                e.__traceback__.tb_frame.f_locals.get('self') is self
-            ):
+            # A bad call raises in this frame; anything from inside the
+            # function has further traceback entries.
+            if e.__traceback__ is not None and e.__traceback__.tb_next is None:
                 raise ArgumentError(str(e)) from None
             raise
 
 
-    _signature: Signature|None = None
+    __signature: Signature
     __signature__: Signature
     @property
     def signature(self) -> Signature:
@@ -103,10 +233,7 @@ class Invoker:
         The signature of the command to be invoked.
 
         """
-        if self._signature is None:
-            self._signature = Signature.from_callable(self.function)
-            self.__signature__ = self._signature
-        return self._signature
+        return self.__signature
 
     __runner_signature: Signature|None = None
     @property
@@ -148,6 +275,18 @@ class BaseSessionInvoker(Generic[R], Invoker):
     variables.
     '''
 
+    __takes_stdout: bool
+    __takes_stderr: bool
+    __takes_stdin: bool
+
+    def __init__(self, cmd: Callable, name: Optional[str] = None, /, **kwargs):
+        super().__init__(cmd, name, **kwargs)
+        # Decided once, rather than consulting the signature on every call.
+        params = self.signature.parameters
+        self.__takes_stdout = 'stdout' in params
+        self.__takes_stderr = 'stderr' in params
+        self.__takes_stdin = 'stdin' in params
+
     @abstractmethod
     def create_runner(self, /, **kwargs) -> R:
         '''
@@ -191,12 +330,11 @@ class BaseSessionInvoker(Generic[R], Invoker):
         '''
         __tracebackhide__ = True
 
-        params = self.signature.parameters
-        if 'stdout' in params:
+        if self.__takes_stdout:
             kwargs['stdout'] = stdout or sys.stdout
-        if 'stderr' in params:
+        if self.__takes_stderr:
             kwargs['stderr'] = stderr or sys.stderr
-        if 'stdin' in params:
+        if self.__takes_stdin:
             kwargs['stdin'] = stdin or sys.stdin
 
         return super().__call__(*args, **kwargs)
@@ -248,6 +386,22 @@ class SharedSessionInvoker(BaseSessionInvoker[run.SharedSessionRunner]):
         '''
         pass
 
+_session_invokers: list['RunnerPerSessionInvoker'] = []
+'''
+The `RunnerPerSessionInvoker` instances to be notified when a session loads,
+in the order they were created. They are held for the life of the module,
+as most are created once, on import, and must be injected again each time
+the xontrib is reloaded.
+'''
+
+# Pytest fails setting a verify attribute on a bound method, so use
+# a real function.
+def _inject_all(**session_args):
+    for invoker in list(_session_invokers):
+        invoker.inject(**session_args)
+events.on_xgit_load(_inject_all)
+
+
 RPSR = TypeVar('RPSR', bound=run.RunnerPerSessionRunner)
 class RunnerPerSessionInvoker(BaseSessionInvoker[RPSR]):
     '''
@@ -287,11 +441,7 @@ class RunnerPerSessionInvoker(BaseSessionInvoker[RPSR]):
         '''
         Registers to be notified of the session
         '''
-        # Pytest fails setting a verify attribute on a bound method, so use
-        # a real function.
-        def on_load(**session_args):
-            self.inject(**session_args)
-        events.on_xgit_load(on_load)
+        _session_invokers.append(self)
 
 
     @abstractmethod
@@ -381,11 +531,25 @@ class CommandInvoker(RunnerPerSessionInvoker):
                 case _:
                     raise ValueError(f"Invalid flag value: {v!r}")
         self.__flags = {k:flag_tuple(k, s) for k, s in  flags.items()}
-        self.__flags_with_signature = None
+        # Every invocation consults the flags, so build them once, up front.
+        self.__flags_with_signature = _signature_flags(self.signature, self.__flags)
+        # Interned keys let hits on the parse path compare by identity.
+        consumers = {
+            sys.intern(name): _flag_consumers(n)
+            for name, n in self.__flags_with_signature.items()
+        }
+        self.__consumers = {name: c for name, (c, _) in consumers.items()}
+        self.__negated_consumers = {name: c for name, (_, c) in consumers.items()}
+        self.__parser = self.__parse if self.__consumers else _parse_no_flags
+        self.__parse_cached = lru_cache(maxsize=256)(self.__parser)
 
 
     __flags: KeywordSpecs
-    __flags_with_signature: KeywordSpecs|None = None
+    __flags_with_signature: KeywordSpecs
+    __consumers: dict[str, FlagConsumer]
+    __negated_consumers: dict[str, FlagConsumer]
+    __parser: Callable[[Sequence[Any]], ArgSplit]
+    __parse_cached: Callable[[tuple[str, ...]], ArgSplit]
     @property
     def flags(self) -> KeywordSpecs:
         """
@@ -413,32 +577,7 @@ class CommandInvoker(RunnerPerSessionInvoker):
         - `+`: One or more arguments follow the keyword.
         - `*`: Zero or more arguments follow the keyword.
         """
-        if (v := self.__flags_with_signature) is not None:
-            return v
-        flags = self.__flags
-        sig = self.signature
-        for p in sig.parameters.values():
-            if p.name in flags:
-                continue
-            match p.kind, p.annotation:
-                case _, cls if isinstance(cls, type) and issubclass(cls, bool):
-                    flags[_h(p.name)] = (True, p.name)
-                case p.POSITIONAL_ONLY, _:
-                    continue
-                case p.POSITIONAL_OR_KEYWORD, _:
-                    flags[_h(p.name)] = (1, p.name)
-                case p.VAR_POSITIONAL, _:
-                    flags[_h(p.name)] = ('*', p.name)
-                case p.KEYWORD_ONLY, _:
-                    flags[_h(p.name)] = (1, p.name)
-                case p.VAR_KEYWORD, _:
-                    continue
-                case _:
-                    continue
-        self.__flags_with_signature = flags
-        return flags
-
-
+        return self.__flags_with_signature
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """
@@ -448,7 +587,12 @@ class CommandInvoker(RunnerPerSessionInvoker):
         """
         __tracebackhide__ = True
         split = self.extract_keywords(args)
-        unified_kwargs = {**split.kwargs, **split.extra_kwargs, **kwargs}
+        # The split is ours, so merge into it rather than copying.
+        unified_kwargs = split.kwargs
+        if split.extra_kwargs:
+            unified_kwargs.update(split.extra_kwargs)
+        if kwargs:
+            unified_kwargs.update(kwargs)
         return super().__call__(*split.args, **unified_kwargs)
 
 
@@ -509,24 +653,21 @@ class CommandInvoker(RunnerPerSessionInvoker):
         string arguments and the session variables.
         '''
         sig: Signature = self.signature
-        params = [
-            p.annotation|str for p in sig.parameters.values()
-            if p.kind in (p.POSITIONAL_OR_KEYWORD, p.POSITIONAL_ONLY, p.VAR_KEYWORD)
-        ]
-        keywords = [
-            t for ts in (
-                (Literal[f'--{p.name}'], p.annotation)
-                for p in sig.parameters.values()
-                if p.kind is p.KEYWORD_ONLY
-            )
-            for t in ts
-        ]
-        session_keywords = [
-            p for p in sig.parameters.values()
-            if p.kind in (p.KEYWORD_ONLY, p.VAR_KEYWORD)
-        ]
-
-        params = tuple(chain(keywords, params))
+        params = []
+        keywords = []
+        session_keywords = []
+        for p in sig.parameters.values():
+            kind = p.kind
+            if kind is p.KEYWORD_ONLY:
+                keywords += (Literal[f'--{p.name}'], p.annotation)
+                session_keywords.append(p)
+            else:
+                if kind is not p.VAR_POSITIONAL:
+                    params.append(p.annotation|str)
+                if kind is p.VAR_KEYWORD:
+                    session_keywords.append(p)
+
+        params = tuple(keywords + params)
         # list_of is a workaround python 3.10.
         args = Parameter('args', Parameter.POSITIONAL_ONLY,
                          annotation=list_of(params))
@@ -570,83 +711,62 @@ class CommandInvoker(RunnerPerSessionInvoker):
         These positional arguments may turn out to match keywords by name in a
         later phase, based on the command's signature.
 
+        Command lines made up only of strings are parsed once and remembered,
+        as the same command is often run repeatedly with the same arguments.
         """
-        s = ArgSplit([], [], {}, {})
-        flags = self.flags
         if not arglist:
-            return s
-        args: list[Any] = list(arglist)
-        def consume_kw_args(arg, n: KeywordSpec, /, *,
-                            to: dict[str, Any] = s.kwargs,
-                         negate: bool = False):
-            match *n, negate:
-                case bool(b), str(k), False:
-                    to[k] = b
-                case bool(b), str(k), True:
-                    to[k] = not b
-                case 0, str(k), _:
-                    to[k] = arg
-                case 1, str(k), False:
-                    to[k] = args.pop(0)
-                case '+', str(k), False:
-                    if len(args) == 0:
-                        raise ArgumentError(f"Missing argument for {arg}")
-                    argl1 = [args.pop(0)]
-                    while (
-                        args
-                        and not (isinstance(args[0], str) and args[0].startswith("-"))
-                    ):
-                       argl1.append(args.pop(0))
-                    to[k] = argl1
-                case '*', str(k), False:
-                    argl2 = []
-                    while (
-                        args
-                        and not (isinstance(args[0], str) and args[0].startswith("-"))
-                    ):
-                        argl2.append(args.pop(0))
-                    to[k] = argl2
-                case _:
-                    raise ValueError(f"Invalid flag usage: {arg} {n!r}")
+            return ArgSplit([], [], {}, {})
+        if all(type(a) is str for a in arglist):
+            return _copy_split(self.__parse_cached(tuple(arglist)))
+        return self.__parser(arglist)
+
+    def __parse(self, arglist: Sequence[Any]) -> ArgSplit:
+        '''
+        Parse the arguments, as described in `extract_keywords`.
+        '''
+        s = ArgSplit([], [], {}, {})
+        consumers_get = self.__consumers.get
+        negated_get = self.__negated_consumers.get
+        positional = s.args
+        kwargs = s.kwargs
+        extra_kwargs = s.extra_kwargs
+        args: deque[Any] = deque(arglist)
+        popleft = args.popleft
         while args:
-            arg = args.pop(0)
-            if isinstance(arg, str):
-                if arg == '-':
-                    s.args.append(arg)
-                elif arg == '--':
-                    s.extra_args.extend(args)
-                    args = []
-                elif arg.startswith("--"):
-                    if "=" in arg:
-                        k, v = arg[2:].split("=", 1)
-                        args.insert(0, v)
-                        if (n := flags.get(k)) is not None:
-                            consume_kw_args(k, n)
-                        else:
-                            consume_kw_args(k, (1, k), to=s.extra_kwargs)
+            arg = popleft()
+            if not isinstance(arg, str) or arg[:1] != '-' or arg == '-':
+                positional.append(arg)
+            elif arg[1:2] != '-':
+                # A cluster of short flags.
+                for ch in arg[1:]:
+                    if (c := consumers_get(ch)) is not None:
+                        c(ch, args, kwargs)
                     else:
-                        if (
-                            arg.startswith("--no-")
-                            and ((n := flags.get(key := arg[5:])) is not None)
-                        ):
-                            consume_kw_args(arg, n, negate=True)
-                        elif ((n:= flags.get(key := arg[2:])) is not None):
-                            consume_kw_args(key, n)
-                        elif arg.startswith("--no-"):
-                            s.extra_kwargs[_u(arg[5:])] = False
-                        else:
-                            s.extra_kwargs[_u(arg[2:])] = True
-                elif arg.startswith("-"):
-                    arg = arg[1:]
-                    for c in arg:
-                        if (n := flags.get(c)) is not None:
-                            consume_kw_args(arg, n)
-                        else:
-                            s.extra_kwargs[c] = True
-                else:
-                    s.args.append(arg)
+                        extra_kwargs[ch] = True
+            elif arg == '--':
+                s.extra_args.extend(args)
+                break
             else:
-                s.args.append(arg)
+                k, sep, v = arg[2:].partition("=")
+                if sep:
+                    if (c := consumers_get(k)) is not None:
+                        args.appendleft(v)
+                        c(k, args, kwargs)
+                    else:
+                        extra_kwargs[k] = v
+                elif k[:3] == "no-":
+                    key = k[3:]
+                    if (c := negated_get(key)) is not None:
+                        c(arg, args, kwargs)
+                    elif (c := consumers_get(k)) is not None:
+                        # A flag whose own name starts with 'no-'.
+                        c(k, args, kwargs)
+                    else:
+                        extra_kwargs[_u(key)] = False
+                elif (c := consumers_get(k)) is not None:
+                    c(k, args, kwargs)
+                else:
+                    extra_kwargs[_u(k)] = True
         return s
 
 
@@ -665,12 +785,13 @@ class PrefixCommandInvoker(CommandInvoker):
         return self.__prefix
 
     __subcommands: dict[str, CommandInvoker]
+    __subcommands_view: MappingProxyType[str, CommandInvoker]
     @property
     def subcommands(self) -> MappingProxyType[str, CommandInvoker]:
         '''
         The subcommands that are recognized by the invoker.
         '''
-        return MappingProxyType(self.__subcommands)
+        return self.__subcommands_view
 
     def add_subcommand(self, subcmd: str, invoker: CommandInvoker):
         '''
@@ -684,9 +805,6 @@ class PrefixCommandInvoker(CommandInvoker):
             The invoker that is used to invoke the subcommand.
         '''
         self.__subcommands[subcmd] = invoker
-        @property
-        def subcommands(self) -> MappingProxyType[str, CommandInvoker]:
-            return MappingProxyType(self.__subcommands)
 
     def create_runner(self, /,
                     **kwargs) -> run.PrefixCommand:
@@ -727,7 +845,7 @@ class PrefixCommandInvoker(CommandInvoker):
         prefix = cmd_ctx.prefix
         if self.prefix.startswith(prefix):
             return {self.prefix}
-        return {f'{self.prefix} {k}' for k in self.subcommands}
+        return {f'{self.prefix} {k}' for k in self.__subcommands}
 
     def __init__(self,
                  cmd: Callable, /,
@@ -736,6 +854,7 @@ class PrefixCommandInvoker(CommandInvoker):
                  **kwargs):
         self.__prefix = prefix
         self.__subcommands = {}
+        self.__subcommands_view = MappingProxyType(self.__subcommands)
         super().__init__(cmd, prefix,
                          flags=flags,
                          **kwargs)
@@ -753,7 +872,7 @@ class PrefixCommandInvoker(CommandInvoker):
                 return
         else:
             subcmd_name = args[0]
-            if subcmd_name not in self.subcommands:
+            subcmd = self.__subcommands.get(subcmd_name)
+            if subcmd is None:
                 raise GitValueError(f"Invalid subcommand: {subcmd_name}")
-            subcmd = self.subcommands[subcmd_name]
             return subcmd(*args[1:], **kwargs)
\ No newline at end of file
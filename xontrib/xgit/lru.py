@@ -0,0 +1,95 @@
+'''
+A bounded mapping that discards the least recently used entries.
+'''
+
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+class LRUCache(Generic[K, V]):
+    '''
+    A mapping holding at most `maxsize` entries. When full, adding an entry
+    discards the one least recently looked up or added.
+
+    Counts hits, misses, and evictions, for a view of how well it is sized.
+    '''
+
+    __data: OrderedDict[K, V]
+
+    __maxsize: int
+    @property
+    def maxsize(self) -> int:
+        '''
+        The most entries that will be kept.
+        '''
+        return self.__maxsize
+
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(self, maxsize: int, /):
+        '''
+        PARAMETERS
+        ----------
+        maxsize: int
+            The most entries that will be kept.
+        '''
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive: {maxsize}")
+        self.__data = OrderedDict()
+        self.__maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        '''
+        Look up `key`, marking it as recently used.
+        '''
+        data = self.__data
+        try:
+            value = data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        data = self.__data
+        data[key] = value
+        data.move_to_end(key)
+        if len(data) > self.__maxsize:
+            data.popitem(last=False)
+            self.evictions += 1
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__data
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def clear(self) -> None:
+        '''
+        Discard all the entries. The counts are kept.
+        '''
+        self.__data.clear()
+
+    def stats(self) -> dict[str, int]:
+        '''
+        The size and the counts of hits, misses, and evictions.
+        '''
+        return {
+            'size': len(self.__data),
+            'maxsize': self.__maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __repr__(self) -> str:
+        return f"LRUCache({len(self.__data)}/{self.__maxsize})"
@@ -14,6 +14,8 @@ In addition, it extends the displayhook to provide the following variables:
 """
 
 from contextlib import suppress
+from functools import cache
+from importlib.metadata import PackageNotFoundError
 from pathlib import Path
 from typing import Any
 from collections.abc import MutableMapping
@@ -26,6 +28,7 @@ from xonsh.execer import Execer
 from xontrib.xgit.decorators import (
     _exports,
     _export,
+    _export_names,
     event_handler,
 )
 from xontrib.xgit.display import (
@@ -41,25 +44,16 @@ from xontrib.xgit.utils import print_if
 
 # Export the functions and values we want to make available.
 
-_export(None, "+")
-_export(None, "++")
-_export(None, "+++")
-_export(None, "-")
-_export(None, "__")
-_export(None, "___")
+_export_names("+", "++", "+++", "-", "__", "___")
 _export("_xgit_counter")
 
-_xgit_version: str = ""
-def     xgit_version():
+@cache
+def xgit_version():
     """
     Return the version of xgit.
     """
-    global _xgit_version
-    if _xgit_version:
-        return _xgit_version
     from importlib.metadata import version
-    _xgit_version = version("xontrib-xgit")
-    return _xgit_version
+    return version("xontrib-xgit")
 
 events.doc('on_xgit_load', 'Runs when the xgit xontrib is loaded.')
 events.doc('on_xgit_unload', 'Runs when the xgit xontrib is unloaded.')
@@ -78,9 +72,18 @@ def _load_xontrib_(xsh: XonshSession, **kwargs) -> dict:
         dict: this will get loaded into the current execution context
     """
 
+    # Assertions are to flag bad test setups. Fetch and check each
+    # once; these run at shell startup.
     env =  xsh.env
     assert isinstance(env, MutableMapping),\
         f"XSH.env is not a MutableMapping: {env!r}"
+    ctx: MutableMapping[str, Any] = xsh.ctx
+    assert isinstance(ctx, MutableMapping),\
+        f"XSH.ctx is not a MutableMapping: {ctx!r}"
+    prompt_fields = env['PROMPT_FIELDS']
+    assert isinstance(prompt_fields, MutableMapping), \
+        f"PROMPT_FIELDS not a MutableMapping: {prompt_fields!r}"
+
     # Set the context on loading.
     env["XGIT_TRACE_LOAD"] = env.get("XGIT_TRACE_LOAD", False)
 
@@ -105,16 +108,7 @@ def _load_xontrib_(xsh: XonshSession, **kwargs) -> dict:
         XGIT.repository = None
         pr(f"XGIT: Closed repository {olddir}")
 
-    # Assertions are to flag bad test
-    env = xsh.env
-    assert isinstance(env, MutableMapping),\
-        f"XSH.env is a MutableMapping {env!r}"
-
-    ctx: MutableMapping[str, Any] = xsh.ctx
-    assert isinstance(ctx, MutableMapping),\
-        f"XSH.ctx is not a MutableMapping: {ctx!r}"
-
-    if "$" in xsh.ctx:
+    if "$" in ctx:
         del env["$"]
 
     # Install our displayhook
@@ -129,10 +123,13 @@ def _load_xontrib_(xsh: XonshSession, **kwargs) -> dict:
     events.on_xgit_unload(unhook_display)
     sys.displayhook = _xgit_displayhook
 
-    prompt_fields = env['PROMPT_FIELDS']
-    assert isinstance(prompt_fields, MutableMapping), \
-        f"PROMPT_FIELDS not a MutableMapping: {prompt_fields!r}"
-    prompt_fields['xgit.version'] = xgit_version
+    # The version can't change while we're loaded, so give the prompt
+    # the string rather than a function to call on every render.
+    try:
+        prompt_fields['xgit.version'] = xgit_version()
+    except PackageNotFoundError:
+        # Not installed (e.g. run from a source tree); only fail if it's shown.
+        prompt_fields['xgit.version'] = xgit_version
 
     if "XGIT_ENABLE_NOTEBOOK_HISTORY" not in env:
         env["XGIT_ENABLE_NOTEBOOK_HISTORY"] = True
@@ -156,29 +153,34 @@ def _unload_xontrib_(xsh: XonshSession, **kwargs) -> dict:
     env = xsh.env
     assert isinstance(env, MutableMapping),\
         f"XSH.env is not a MutableMapping: {env!r}"
+    ctx = xsh.ctx
+    prompt_fields = env['PROMPT_FIELDS']
+    assert isinstance(prompt_fields, MutableMapping),\
+        "PROMPT_FIELDS not a MutableMapping"
 
     if env.get("XGIT_TRACE_LOAD"):
         print("Unloading xontrib-xgit", file=sys.stderr)
 
-    if "_XGIT_RETURN" in xsh.ctx:
-        del xsh.ctx["_XGIT_RETURN"]
+    if "_XGIT_RETURN" in ctx:
+        del ctx["_XGIT_RETURN"]
 
     sys.displayhook = _xonsh_displayhook
 
-    env = xsh.env
-    assert isinstance(env, MutableMapping),\
-        f"XSH.env is not a MutableMapping: {env!r}"
-    prompt_fields = env['PROMPT_FIELDS']
-    assert isinstance(prompt_fields, MutableMapping),\
-        "PROMPT_FIELDS not a MutableMapping"
-
     if env.get("XGIT_TRACE_LOAD"):
         print("Unloaded xontrib-xgit", file=sys.stderr)
     if 'xgit.version' in prompt_fields:
         del prompt_fields['xgit.version']
 
-    assert xsh.env is not None
-    events.on_xgit_unload.fire(XSH=xsh, XGIT=xsh.env['XGIT'])
+    ct._forget_worktrees()
+
+    XGIT = env['XGIT']
+    events.on_xgit_unload.fire(XSH=xsh, XGIT=XGIT)
+
+    # Stop any cat-file processes and close the object caches.
+    if isinstance(XGIT, ct._GitContext):
+        for repository in XGIT.repositories.values():
+            repository.close()
+        XGIT.close()
 
     return dict()
 
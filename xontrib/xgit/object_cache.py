@@ -0,0 +1,100 @@
+'''
+A persistent cache of data read from git objects, shared between sessions.
+
+Git objects are identified by the hash of their content, so anything read
+from an object can be kept indefinitely. The cache is a SQLite database per
+repository, kept in the directory named by `$XGIT_CACHE_DIR`.
+'''
+
+from hashlib import sha1
+from pathlib import Path
+import sqlite3
+from threading import Lock
+
+MAX_OBJECT_SIZE = 64 * 1024
+'''
+The contents of larger objects are not cached; reading them from git
+costs little by comparison, and they would bloat the cache.
+'''
+
+class ObjectCache:
+    '''
+    A persistent store of data read from git objects, keyed by the object's
+    hash and the kind of data (e.g. the object's content, or a tree listing).
+
+    Safe to share between threads, and between sessions; the database is in
+    WAL mode, so concurrent readers are not blocked by a writer.
+    '''
+
+    __db: sqlite3.Connection|None
+    __lock: Lock
+
+    def __init__(self, path: Path, /):
+        '''
+        Open (creating if necessary) the cache database at `path`.
+
+        PARAMETERS
+        ----------
+        path: Path
+            The database file.
+        '''
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.__db = sqlite3.connect(path, check_same_thread=False,
+                                    isolation_level=None)
+        self.__db.execute('PRAGMA journal_mode=WAL')
+        self.__db.execute('''CREATE TABLE IF NOT EXISTS objects (
+                                hash TEXT NOT NULL,
+                                kind TEXT NOT NULL,
+                                payload BLOB NOT NULL,
+                                PRIMARY KEY (hash, kind)
+                            ) WITHOUT ROWID''')
+        self.__lock = Lock()
+
+    @staticmethod
+    def for_repository(cache_dir: Path|str, repository: Path, /) -> 'ObjectCache':
+        '''
+        Open the cache for the repository at `repository`, in `cache_dir`.
+
+        PARAMETERS
+        ----------
+        cache_dir: Path|str
+            The directory holding the caches for all repositories.
+        repository: Path
+            The path to the repository (the common part, shared by worktrees).
+        '''
+        name = sha1(str(repository.resolve()).encode()).hexdigest()
+        return ObjectCache(Path(cache_dir).expanduser() / f'{name}.sqlite')
+
+    def get(self, hash: str, kind: str, /) -> bytes | None:
+        '''
+        Get the cached `kind` of data for the object `hash`, or `None`.
+        '''
+        with self.__lock:
+            if self.__db is None:
+                return None
+            row = self.__db.execute(
+                'SELECT payload FROM objects WHERE hash=? AND kind=?',
+                (hash, kind),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def put(self, hash: str, kind: str, payload: bytes, /) -> None:
+        '''
+        Remember the `kind` of data for the object `hash`.
+        '''
+        with self.__lock:
+            if self.__db is None:
+                return
+            self.__db.execute(
+                'INSERT OR IGNORE INTO objects (hash, kind, payload) VALUES (?, ?, ?)',
+                (hash, kind, payload),
+            )
+
+    def close(self) -> None:
+        '''
+        Close the database. Further lookups miss, and nothing more is stored.
+        '''
+        with self.__lock:
+            if self.__db is not None:
+                self.__db.close()
+                self.__db = None
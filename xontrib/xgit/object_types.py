@@ -62,6 +62,9 @@ class GitId(Protocol):
     """
     Anything that has a hash in a git repository.
     """
+    # No instance dict; implementations can then use __slots__.
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, hash: ObjectId):
         ...
@@ -75,6 +78,8 @@ class GitObject(GitId, Protocol):
     """
     A git object.
     """
+    __slots__ = ()
+
     @property
     @abstractmethod
     def type(self) -> GitObjectType:
@@ -109,6 +114,8 @@ class GitTree(GitObject, dict[str, 'et.GitEntry[EntryObject]']):
     """
     A git tree object.
     """
+    __slots__ = ()
+
     @property
     def type(self) -> Literal['tree']:
         return 'tree'
@@ -221,6 +228,8 @@ class GitBlob(GitObject, Protocol):
     """
     A git blob object.
     """
+    __slots__ = ()
+
     @property
     def type(self) -> Literal['blob']:
         return 'blob'
@@ -232,14 +241,25 @@ class GitBlob(GitObject, Protocol):
     @property
     @abstractmethod
     def data(self) -> bytes:
+        '''
+        The contents of the blob. Nothing is read until this is accessed,
+        so listing trees never reads the files in them.
+        '''
         ...
     @property
     @abstractmethod
     def lines(self) -> Iterator[str]:
+        '''
+        The lines of the blob, read as they are iterated, without
+        holding the whole contents in memory.
+        '''
         ...
     @property
     @abstractmethod
     def stream(self) -> IO[str]:
+        '''
+        A stream of the contents of the blob, read as it is consumed.
+        '''
         ...
 
 
@@ -248,6 +268,8 @@ class GitCommit(GitObject, Protocol):
     """
     A git commit object.
     """
+    __slots__ = ()
+
     @property
     def type(self) -> Literal['commit']:
         return 'commit'
@@ -284,6 +306,8 @@ class GitTagObject(GitObject, Protocol):
     """
     A git tag object.
     """
+    __slots__ = ()
+
     @property
     def type(self) -> Literal['tag']:
         return 'tag'
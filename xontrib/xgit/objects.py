@@ -29,10 +29,14 @@ from typing import (
     Optional, Literal, Any, cast, TypeAlias,
     Callable, overload
 )
-from collections.abc import MutableMapping, Sequence, Iterable, Iterator, Mapping
+from collections.abc import Sequence, Iterable, Iterator, Mapping
 from types import MappingProxyType
 from pathlib import PurePosixPath
 from collections import defaultdict
+from os import fsdecode
+from io import BytesIO, TextIOWrapper
+from functools import lru_cache
+import codecs
 
 from xonsh.built_ins import XSH
 from xonsh.lib.pretty import RepresentationPrinter
@@ -48,6 +52,7 @@ from xontrib.xgit.types import (
     BlobId,
     GitEntryMode,
     GitObjectType,
+    _OBJECT_TYPES,
     InitFn,
 )
 from xontrib.xgit.object_types import (
@@ -64,14 +69,71 @@ from xontrib.xgit.entry_types import (
     OBJ, ParentObject, EntryObject, GitEntry, GitEntryTree, GitEntryBlob, GitEntryCommit
 )
 import xontrib.xgit.entries as xe
-import xontrib.xgit.git_cmd as gc
 
 GitContextFn: TypeAlias = Callable[[], GitContext]
 
+_MODE_TYPES: dict[str, GitObjectType] = {
+    '040000': 'tree',
+    '160000': 'commit',
+}
+'''
+The object types of tree entries that are not blobs, by mode.
+'''
+
+_RAW_MODES: dict[bytes, GitEntryMode] = {
+    m.lstrip('0').encode(): cast(GitEntryMode, m)
+    for m in xe._MODE_INTERN.values()
+}
+'''
+The shared mode strings, by their form in a raw tree object.
+'''
+
+def _commit_encoding(header: bytes) -> str:
+    '''
+    The encoding named by a commit's `encoding` header, if it has one
+    that Python knows, else UTF-8, git's default.
+    '''
+    at = header.find(b'\nencoding ')
+    if at < 0:
+        return 'utf-8'
+    name = header[at + 10:].split(b'\n', 1)[0].decode('ascii', 'replace')
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return 'utf-8'
+
+@lru_cache(maxsize=8192)
+def _entry_name(raw: bytes) -> str:
+    '''
+    Decode a name from a raw tree entry.
+
+    The same names (`README.md`, `__init__.py`, ...) recur across a
+    repository's trees and their many versions. Remembering them skips
+    decoding them again, and lets all their entries share one string.
+    '''
+    return fsdecode(raw)
+
+def _trace_objects() -> bool:
+    '''
+    Whether `$XGIT_TRACE_OBJECTS` asks for each entry made to be printed.
+    '''
+    env = XSH.env
+    return bool(env is not None and env.get("XGIT_TRACE_OBJECTS"))
+
+_SMALL_BLOB = 64 * 1024
+'''
+Blobs up to this size are read whole through the persistent `cat-file`
+process, rather than starting `git` to stream them.
+'''
+
 class _GitId(GitId):
     """
     Anything that has a hash in a git repository.
     """
+    # Each concrete class lists all its fields, these included, in its
+    # own __slots__. A tree is also a dict, whose instance layout can't be
+    # combined with a base class that has slots of its own.
+    __slots__ = ()
 
     _hash: ObjectId
     @property
@@ -108,17 +170,22 @@ class _GitObject(_GitId, GitObject):
     """
     Any object stored in a git repository. Holds the hash and type of the object.
     """
-    _size: int|InitFn['_GitObject', int]
+    __slots__ = ()
+
+    _size: int
+    '''
+    The size of the object, or -1 until it is known.
+    '''
     @property
     def size(self) -> int:
-        if callable(self._size):
-            self._size = self._size(self)
+        if self._size < 0:
+            self._size = self._compute_size()
         return self._size
 
     def __init__(
         self,
         hash: ObjectId,
-        size: int|InitFn['_GitObject',int]=-1,
+        size: int=-1,
         /,
     ):
         self._size = size
@@ -127,20 +194,31 @@ class _GitObject(_GitId, GitObject):
             hash
         )
 
-    def _size_loader(self, repository: 'gc.GitCmd') -> InitFn['_GitObject',int]:
+    def _compute_size(self) -> int:
         '''
-        Subclasses can call this when they don't know the size of the object.
-        It returns a function that lazily loads the size from the repository.
+        Find the size of the object, when it was not known on creation.
+        Subclasses implement this in whatever way is cheapest for them.
         '''
-        def loader(self: _GitObject):
-            size = repository.git_string("cat-file", "-s", self.hash)
-            return int(size)
-        return loader
+        raise NotImplementedError("Must be implemented in a subclass")
 
     @property
     def type(self):
         raise NotImplementedError("Must be implemented in a subclass")
 
+    def _unloaded(self) -> bool:
+        '''
+        Whether the object has content still to be read from git and parsed.
+        Objects that hold none of their content never do.
+        '''
+        return False
+
+    def _load_from(self, raw: bytes, /) -> None:
+        '''
+        Load the object from its raw content, read ahead by the caller
+        (e.g. together with other objects, in one round trip).
+        '''
+        pass
+
     def __format__(self, fmt: str):
         return f"{self.type} {super().__format__(fmt)}"
 
@@ -157,8 +235,15 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
 
     Updates would make no sense, as this would invalidate the hash.
     """
+    __slots__ = ('__hashes', '__hashes_view', '__lazy_loader', '__raw',
+                 '__repository', '_hash', '_size')
 
     __lazy_loader: InitFn['_GitTree',Iterable[tuple[str,GitEntry]]] | None
+    __raw: bytes|None
+    '''
+    The content of the tree, when it has been read ahead of loading it.
+    '''
+    __repository: GitRepository
 
     @property
     def hash(self) -> TreeId:
@@ -169,6 +254,7 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
 
 
     __hashes: defaultdict[ObjectId, IdentitySet[GitEntry,int]]
+    __hashes_view: MappingProxyType[ObjectId, IdentitySet[GitEntry,int]]|None
     @property
     def hashes(self) -> Mapping[ObjectId, IdentitySet[GitEntry,int]]:
         '''
@@ -179,7 +265,9 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
         '''
         if self.__lazy_loader is not None:
             self._expand()
-        return MappingProxyType(self.__hashes)
+        if (hashes := self.__hashes_view) is None:
+            hashes = self.__hashes_view = MappingProxyType(self.__hashes)
+        return hashes
 
 
     def __init__(
@@ -191,22 +279,21 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
     ):
         def _lazy_loader(self: '_GitTree'):
             self.__hashes = defaultdict(lambda: IdentitySet(key=id))
-            for line in repository.git_lines("ls-tree", "--long", tree):
-                if line:
-                    name, entry = self._parse_git_entry(line, repository, tree)
-                    self.__hashes[entry.hash].add(entry)
-                    yield name, entry
+            raw = self.__raw
+            if raw is None:
+                raw = repository.cat_file_batch(tree)
+            self.__raw = None
+            for name, entry in self._parse_tree(raw, repository):
+                self.__hashes[entry.hash].add(entry)
+                yield name, entry
             self.__lazy_loader = None
             self._size = dict.__len__(self)
-            for entry in self.values():
-                repository.add_reference(entry.hash, entry)
         self.__lazy_loader = _lazy_loader
+        self.__raw = None
+        self.__repository = repository
+        self.__hashes_view = None
         dict.__init__(self)
-        _GitObject.__init__(
-            self,
-            tree,
-            lambda _: len(self._expand()),
-        )
+        _GitObject.__init__(self, tree)
         ent = xe._GitEntryTree(self, '.', "040000", repository, PurePosixPath())
         dict.__setitem__(self, '.', ent)
 
@@ -216,24 +303,70 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
             dict.update(self, i)
         return self
 
+    def _compute_size(self) -> int:
+        return len(self)
+
+    def _unloaded(self) -> bool:
+        return self.__lazy_loader is not None
+
+    def _load_from(self, raw: bytes, /) -> None:
+        if self.__lazy_loader is not None:
+            self.__raw = raw
+            self._expand()
+
+    def _expand_all(self) -> '_GitTree':
+        '''
+        Load this tree and every tree below it, a level at a time. The
+        trees of each level that aren't yet loaded are read from git in
+        one round trip, rather than one per tree.
+        '''
+        level: list[_GitTree] = [self]
+        while level:
+            # A subtree that appears in several places is fetched once.
+            pending: dict[str, list[_GitTree]] = {}
+            for t in level:
+                if t.__lazy_loader is not None:
+                    pending.setdefault(t.hash, []).append(t)
+            if pending:
+                fetched = self.__repository.cat_file_batch_many(*pending)
+                for trees, (_, _, raw) in zip(pending.values(), fetched,
+                                              strict=True):
+                    for t in trees:
+                        t._load_from(raw)
+            subtrees = (cast(_GitTree, e.object)
+                        for t in level
+                        for name, e in dict.items(t)
+                        if name != '.' and e.type == 'tree')
+            level = list({id(t): t for t in subtrees}.values())
+        return self
+
     @property
     def type(self) -> Literal["tree"]:
         return "tree"
 
+    # Trees are identified by their hash, so hashing and comparing them
+    # doesn't need their entries loaded.
     def __hash__(self): # type: ignore
-        return _GitObject.__hash__(self._expand())
+        return _GitObject.__hash__(self)
 
     def __eq__(self, other):
-        return _GitObject.__eq__(self._expand(), other)
+        return _GitObject.__eq__(self, other)
 
     def __repr__(self):
         return f"GitTree(hash={self.hash})"
 
+    # The read methods check for a pending load inline, rather than
+    # calling `_expand` on every access of an already loaded tree.
+
     def __len__(self):
-        return dict.__len__(self._expand())
+        if self.__lazy_loader is not None:
+            self._expand()
+        return dict.__len__(self)
 
     def __contains__(self, key):
-        return dict.__contains__(self._expand(), key)
+        if self.__lazy_loader is not None:
+            self._expand()
+        return dict.__contains__(self, key)
 
 
     def __getitem__(self, key: str) -> GitEntry[EntryObject]:
@@ -249,37 +382,48 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
         raise NotImplementedError("Cannot delete items in a GitTree")
 
     def __iter__(self) -> Iterator[str]:
-        return dict.__iter__(self._expand())
+        if self.__lazy_loader is not None:
+            self._expand()
+        return dict.__iter__(self)
 
     def __bool__(self):
-        return len(self._expand()) > 0
+        if self.__lazy_loader is not None:
+            self._expand()
+        return dict.__len__(self) > 0
 
     def __reversed__(self) -> Iterator[str]:
-        self._expand()
-        return super().__reversed__()
+        if self.__lazy_loader is not None:
+            self._expand()
+        return dict.__reversed__(self)
 
     def items(self):
-        return dict.items(self._expand())
+        if self.__lazy_loader is not None:
+            self._expand()
+        return dict.items(self)
 
     def keys(self):
-        return dict.keys(self._expand())
+        if self.__lazy_loader is not None:
+            self._expand()
+        return dict.keys(self)
 
     def values(self):
-        return dict.values(self._expand())
+        if self.__lazy_loader is not None:
+            self._expand()
+        return dict.values(self)
 
     def get(self,
             key: str|PurePosixPath,
             default: Any = None,
             ) -> 'GitEntry[xe.EntryObject]':
-        self._expand()
-        ex = next(iter(dict.values(self)))
-        repository = ex.repository
-        _, loc = self._git_entry(self.hash, '.', "040000", "tree", -1,
-                              repository=repository)
-
-        key_path = PurePosixPath(key)
-        path = PurePosixPath()
-        for p in key_path.parts:
+        if self.__lazy_loader is not None:
+            self._expand()
+        # A plain name (the usual case) is looked up directly.
+        if type(key) is str and key and key != '..' and '/' not in key:
+            return dict.get(self, key, default)
+        # Start from our own '.' entry; building a new one would mean
+        # loading a fresh copy of this tree for every lookup.
+        loc = dict.__getitem__(self, '.')
+        for p in PurePosixPath(key).parts:
             if p in ('', '.'):
                 continue
             if p == '..':
@@ -289,7 +433,6 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
                 loc = dict.__getitem__(loc.object, p)
             except KeyError:
                 return default
-            path = path / p
         return loc
 
 
@@ -324,22 +467,56 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
             with p.group(4, f"GitTree({self.hash!r}, len={tree_len}, '''", "\n''')"):
                 for e in self.values():
                     p.break_()
-                    if e.type == "tree":
-                        rw = "D"
-                    elif e.mode == "120000":
-                        rw = "L"
-                    elif e.mode == "160000":
-                        rw = "S"
-                    elif e.mode == "100755":
-                        rw = "X"
-                    else:
-                        rw = "-"
                     size = int(e.size)
                     suffix = '/' if e.type == 'tree' else ''
-                    tree_len = f'{rw} {e.hash} {size:>8d} {e.name}{suffix}'
+                    tree_len = f'{e.prefix} {e.hash} {size:>8d} {e.name}{suffix}'
                     p.text(tree_len)
 
 
+    def _parse_tree(
+        self,
+        raw: bytes,
+        repository: GitRepository,
+    ) -> list[tuple[str, GitEntry]]:
+        """
+        Parse the raw content of a tree object in one pass.
+
+        Each entry is `<mode> SP <name> NUL <binary hash>`. Names are not
+        quoted, so names with spaces or other special characters come
+        through intact. Sizes are left to be loaded when asked for; the
+        first one asked for loads those of all the tree's files at once.
+        """
+        sizes: dict[ObjectId, int] = {}
+        def blob_size(blob: _GitObject) -> int:
+            if not sizes:
+                blobs = [e.hash for _, e in entries if e.type == 'blob']
+                sizes.update((hash, size) for hash, _, size
+                             in repository.cat_file_check_many(*blobs))
+            return sizes[blob.hash]
+        git_entry = self._git_entry
+        entry_name = _entry_name
+        trace = _trace_objects()
+        width = len(self.hash) // 2
+        entries: list[tuple[str, GitEntry]] = []
+        append = entries.append
+        find = raw.find
+        i, end = 0, len(raw)
+        while i < end:
+            sp = find(b' ', i)
+            nul = find(b'\0', sp)
+            # Trees are stored as '40000'; `git ls-tree` shows '040000'.
+            mode = _RAW_MODES.get(raw[i:sp]) or raw[i:sp].decode().zfill(6)
+            i = nul + 1 + width
+            type = _MODE_TYPES.get(mode, 'blob')
+            append(git_entry(ObjectId(raw[nul + 1:i].hex()),
+                             entry_name(raw[sp + 1:nul]),
+                             cast(GitEntryMode, mode),
+                             type,
+                             blob_size if type == 'blob' else -1,
+                             repository, self, trace=trace))
+        return entries
+
+
     def _parse_git_entry(
         self,
         line: str,
@@ -349,13 +526,14 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
         """
         Parse a line from `git ls-tree --long` and return a `GitObject`.
         """
-        mode, type, hash, size, name = line.split()
-        mode = cast(GitEntryMode, mode)
-        type = cast(GitObjectType, type)
+        # The name follows a tab, and may itself contain spaces.
+        fields, name = line.split('\t', 1)
+        mode, type, hash, size = fields.split()
+        type = _OBJECT_TYPES[type]
         parent = repository.get_object(parent_hash) if parent_hash is not None else None
         size_ = -1 if size == '-' else int(size)
-        return self._git_entry(ObjectId(hash), name, mode, type, size_,
-                               repository, parent)
+        return self._git_entry(ObjectId(hash), name, cast(GitEntryMode, mode),
+                               type, size_, repository, parent)
 
 
     @overload
@@ -370,6 +548,8 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
         parent: Optional[GitObject] = None,
         parent_entry: Optional[GitEntryTree] = None,
         path: Optional[PurePosixPath] = None,
+        *,
+        trace: Optional[bool] = None,
     ) -> tuple[str, GitEntryCommit]: ...
 
     @overload
@@ -379,11 +559,13 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
         name: str,
         mode: GitEntryMode,
         type: Literal['blob'],
-        size: int,
+        size: int|InitFn[_GitObject,int],
         repository: GitRepository,
         parent: Optional[GitObject] = None,
         parent_entry: Optional[GitEntryTree] = None,
         path: Optional[PurePosixPath] = None,
+        *,
+        trace: Optional[bool] = None,
     ) -> tuple[str, GitEntryBlob]: ...
 
     @overload
@@ -398,6 +580,8 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
         parent: Optional[GitObject] = None,
         parent_entry: Optional[GitEntryTree] = None,
         path: Optional[PurePosixPath] = None,
+        *,
+        trace: Optional[bool] = None,
     ) -> tuple[str, GitEntryTree]: ...
 
     @overload
@@ -407,11 +591,13 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
         name: str,
         mode: GitEntryMode,
         type: GitObjectType,
-        size: int,
+        size: int|InitFn[_GitObject,int],
         repository: GitRepository,
         parent: Optional[GitObject] = None,
         parent_entry: Optional[GitEntryTree] = None,
         path: Optional[PurePosixPath] = None,
+        *,
+        trace: Optional[bool] = None,
     ) -> tuple[str, GitEntry[OBJ]]: ...
 
     # Implementation
@@ -421,11 +607,13 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
         name: str,
         mode: GitEntryMode,
         type: GitObjectType,
-        size: int,
+        size: int|InitFn[_GitObject,int],
         repository: GitRepository,
         parent: Optional[GitObject] = None,
         parent_entry: Optional[GitEntryTree] = None,
         path: Optional[PurePosixPath] = None,
+        *,
+        trace: Optional[bool] = None,
     ) -> tuple[str, GitEntry[OBJ]]:
         """
         Obtain or create a `GitObject` from a parsed entry line or equivalent.
@@ -450,10 +638,10 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
             The parent object of the object.
         parent_entry: Optional[GitEntryTree]
             The parent entry of the object, where it was found.
+        trace: Optional[bool]
+            Whether to print the entry, per `$XGIT_TRACE_OBJECTS`. Callers
+            making many entries look this up once and pass it in.
         """
-        assert isinstance(XSH.env, MutableMapping),\
-            f"XSH.env not a MutableMapping: {XSH.env!r}"
-
         match hash_or_obj:
             case str():
                 hash: Objectish = hash_or_obj
@@ -464,14 +652,19 @@ class _GitTree(_GitObject, GitTree, dict[str, GitEntry[EntryObject]]):
             case _:
                 raise ValueError(f"Invalid hash or object: {hash_or_obj}")
 
-        if XSH.env.get("XGIT_TRACE_OBJECTS"):
+        if trace is None:
+            trace = _trace_objects()
+        if trace:
+            # Sizes not yet loaded are shown as unknown.
+            size = size if isinstance(size, int) else -1
             args = (
                 f"{hash=}, {name=}, {mode=}, {type=}, {size=}, " +
                 f"{repository.path=}, {parent=}"
             )
             msg = f"git_entry({args})"
             print(msg)
-        this_path = path / name if path is not None else PurePosixPath() / name
+        # A str; the entry makes a path of it only if asked for one.
+        this_path = f'{path}/{name}' if path is not None else name
         match type:
             case 'tree':
                 entry = xe._GitEntryTree(cast(GitTree, obj), name, mode,
@@ -500,6 +693,13 @@ class _GitBlob(_GitObject, GitBlob):
     """
     A file ("blob") stored in a git repository.
     """
+    __slots__ = ('__repository', '__size_loader', '_hash', '_size')
+
+    __size_loader: InitFn[_GitObject,int]|None
+    '''
+    Finds the size, if one was supplied in place of the size itself
+    (e.g. one shared by a tree, to find the sizes of all its files at once).
+    '''
 
     __repository: GitRepository
     '''
@@ -528,8 +728,11 @@ class _GitBlob(_GitObject, GitBlob):
         *,
         repository: GitRepository,
     ):
-        if isinstance(size, int) and size < 0:
-            size = self._size_loader(repository)
+        if callable(size):
+            self.__size_loader = size
+            size = -1
+        else:
+            self.__size_loader = None
         _GitObject.__init__(
             self,
             hash,
@@ -537,6 +740,13 @@ class _GitBlob(_GitObject, GitBlob):
         )
         self.__repository = repository
 
+    def _compute_size(self) -> int:
+        if (loader := self.__size_loader) is not None:
+            self.__size_loader = None
+            return loader(self)
+        _, _, size = self.__repository.cat_file_check(self.hash)
+        return size
+
 
     def __str__(self):
         return f"{self.type} {self.hash} {self.size:>8d}"
@@ -579,34 +789,47 @@ class _GitBlob(_GitObject, GitBlob):
         """
         Return the contents of the file.
         """
-        return self.__repository.git_binary("cat-file", "blob", self.hash).read()
+        return self.__repository.cat_file_batch(self.hash)
 
 
     @property
     def stream(self):
         """
         Return the contents of the file.
+
+        Small files are read through the repository's persistent `cat-file`
+        process; larger ones are streamed from a `git` process of their own.
         """
+        if self.size <= _SMALL_BLOB:
+            return TextIOWrapper(BytesIO(self.data))
         return self.__repository.git_stream("cat-file", "blob", self.hash)
 
 
     @property
     def lines(self):
+        if self.size <= _SMALL_BLOB:
+            return (line[:-1] if line[-1:] == '\n' else line
+                    for line in TextIOWrapper(BytesIO(self.data)))
         return self.__repository.git_lines("cat-file", "blob", self.hash)
 
 
     @property
     def text(self):
-        return self.__repository.git_stream("cat-file", "blob", self.hash,
-                                            text=True,
-                                            ).read()
+        # Decoded as a text-mode pipe would, but read through the
+        # repository's persistent `cat-file` process.
+        return TextIOWrapper(BytesIO(self.data)).read()
 
 
 class _GitCommit(_GitObject, GitCommit):
     """
     A commit in a git repository.
     """
+    __slots__ = ('__author', '__committer', '__loader', '__message',
+                 '__parents', '__raw', '__signature', '__tree', '_hash',
+                 '_size')
+
     __loader: GitLoader|None
+    __raw: bytes|None
     @property
     def type(self) -> Literal["commit"]:
         return "commit"
@@ -640,11 +863,13 @@ class _GitCommit(_GitObject, GitCommit):
         return self.__parents
 
 
-    __message: str
+    __message: str|InitFn[GitCommit, str]
     @property
     def message(self) -> str:
         if self.__loader:
             self.__loader()
+        if callable(self.__message):
+            self.__message = self.__message(self)
         return self.__message
 
     __author: CommittedBy
@@ -680,46 +905,76 @@ class _GitCommit(_GitObject, GitCommit):
         return self.__signature
 
 
-    def __init__(self, hash: str, /, *, repository: GitRepository):
+    def __init__(self, hash: str, size: int=-1, /, *, repository: GitRepository):
         def loader():
-            lines = repository.git_lines("cat-file", "commit", hash)
-            tree = TreeId(ObjectId(next(lines).split()[1]))
-            def load_tree(_):
+            raw = self.__raw
+            if raw is None:
+                raw = repository.cat_file_batch(hash)
+            self.__raw = None
+            # The headers end at the first blank line; continuation lines
+            # (e.g. of a signature) start with a space, so can't be blank.
+            header, _, body = raw.partition(b'\n\n')
+            # Names and the message are in the commit's declared encoding.
+            encoding = _commit_encoding(header)
+            tree: TreeId|None = None
+            parents: list[GitCommit] = []
+            sig_lines: list[str] = []
+            field = ''
+            for line in header.decode(encoding, 'replace').split('\n'):
+                if line[:1] == ' ':
+                    if field == 'gpgsig':
+                        sig_lines.append(line)
+                    continue
+                field, _, value = line.partition(' ')
+                match field:
+                    case 'tree':
+                        tree = TreeId(ObjectId(value))
+                    case 'parent':
+                        id = CommitId(ObjectId(value))
+                        parents.append(repository.get_object(id, 'commit'))
+                    case 'author':
+                        self.__author = CommittedBy(value,
+                                                    repository=repository)
+                    case 'committer':
+                        self.__committer = CommittedBy(value,
+                                                       repository=repository)
+                    case 'gpgsig':
+                        sig_lines.append(line)
+                    case _:
+                        # Other headers (encoding, mergetag, ...) aren't kept.
+                        pass
+            if tree is None:
+                raise ValueError(f"Commit {hash} has no tree")
+            def load_tree(_, tree=tree):
                 return repository.get_object(tree, 'tree')
             self.__tree = load_tree
-            self.__parents = []
-            in_sig = False
-            msg_lines = []
-            sig_lines = []
-            for line in lines:
-                if line.startswith("parent"):
-                    id = ObjectId(line.split()[1])
-                    self.__parents.append(repository.get_object(CommitId(id), 'commit'))
-                elif line.startswith("author"):
-                    author_line = line.split(maxsplit=1)[1]
-                    self.__author = CommittedBy(author_line,
-                                                repository=repository)
-                elif line.startswith("committer"):
-                    committer_line = line.split(maxsplit=1)[1]
-                    self.__committer = CommittedBy(committer_line,
-                                                   repository=repository)
-                elif line == 'gpgsig -----BEGIN PGP SIGNATURE-----':
-                    in_sig = True
-                    sig_lines.append(line)
-                elif in_sig:
-                    sig_lines.append(line)
-                    if line.strip() == "-----END PGP SIGNATURE-----":
-                        in_sig = False
-                elif line == "":
-                    break
-                else:
-                    raise ValueError(f"Unexpected line: {line}")
-            msg_lines.extend(lines)
-            self.__message = "\n".join(msg_lines)
+            self.__parents = parents
+            def load_message(_):
+                return "\n".join(body.decode(encoding, 'replace').splitlines())
+            self.__message = load_message
             self.__signature = "\n".join(sig_lines)
-            self._size = 0
+            # The size is the length of the content, now in hand.
+            self._size = len(raw)
+            # Loaded; the properties now just return the fields.
+            self.__loader = None
         self.__loader = loader
-        _GitObject.__init__(self, ObjectId(hash), self._size_loader(repository))
+        self.__raw = None
+        _GitObject.__init__(self, ObjectId(hash), size)
+
+    def _compute_size(self) -> int:
+        # Loading the content sets the size; it is small, and usually
+        # wanted anyway.
+        if self.__loader is not None:
+            self.__loader()
+        return self._size
+
+    def _unloaded(self) -> bool:
+        return self.__loader is not None
+
+    def _load_from(self, raw: bytes, /) -> None:
+        if self.__loader is not None:
+            self.__raw = raw
+            self.__loader()
 
     def __str__(self):
         return f"commit {self.hash}"
@@ -768,8 +1023,11 @@ class _GitTagObject(_GitObject, GitTagObject):
     A tag in a git repository.
     This is an actual signed tag object, not just a reference.
     """
+    __slots__ = ('__loader', '__message', '__object', '__raw', '__signature',
+                 '__tag_name', '__tag_type', '__tagger', '_hash', '_size')
 
     __loader: GitLoader|None
+    __raw: bytes|None
 
     @property
     def type(self) -> Literal["tag"]:
@@ -841,7 +1099,7 @@ class _GitTagObject(_GitObject, GitTagObject):
         return self.__signature
 
 
-    def __init__(self, hash: TagId, /, *,
+    def __init__(self, hash: TagId, size: int=-1, /, *,
                  repository: GitRepository):
         '''
         Initialize a tag object from a hash.
@@ -853,7 +1111,11 @@ class _GitTagObject(_GitObject, GitTagObject):
             '''
             Load the tag object from the repository in response to a property access.
             '''
-            lines = repository.git_lines("cat-file", "tag", hash)
+            raw = self.__raw
+            if raw is None:
+                raw = repository.cat_file_batch(hash)
+            self.__raw = None
+            lines = iter(raw.decode().splitlines())
             for line in lines:
                 if line.startswith("object"):
                     # Bind the loop variable so it gets its own closure
@@ -866,11 +1128,11 @@ class _GitTagObject(_GitObject, GitTagObject):
                     self.__object = obj_loader(line)
                 elif line.startswith("type"):
                     tag_type = line.split()[1]
-                    assert tag_type in ("commit", "tree", "blob", "tag")
-                    self.__tag_type = tag_type
-                elif line.startswith("tag"):
+                    assert tag_type in _OBJECT_TYPES
+                    self.__tag_type = _OBJECT_TYPES[tag_type]
+                elif line.startswith("tag "):
                     self.__tag_name = line.split(maxsplit=1)[1]
-                elif line.startswith("tagger"):
+                elif line.startswith("tagger "):
                     tagger_line = line.split(maxsplit=1)[1]
                     self.__tagger = CommittedBy(tagger_line,
                                                 repository=repository)
@@ -889,8 +1151,28 @@ class _GitTagObject(_GitObject, GitTagObject):
             for line in lines:
                 sig_lines.append(line)
             self.__signature = "\n".join(sig_lines)
+            # The size is the length of the content, now in hand.
+            self._size = len(raw)
+            # Loaded; the properties now just return the fields.
+            self.__loader = None
         self.__loader = loader
-        _GitObject.__init__(self, ObjectId(hash), self._size_loader(repository))
+        self.__raw = None
+        _GitObject.__init__(self, ObjectId(hash), size)
+
+    def _compute_size(self) -> int:
+        # Loading the content sets the size; it is small, and usually
+        # wanted anyway.
+        if self.__loader is not None:
+            self.__loader()
+        return self._size
+
+    def _unloaded(self) -> bool:
+        return self.__loader is not None
+
+    def _load_from(self, raw: bytes, /) -> None:
+        if self.__loader is not None:
+            self.__raw = raw
+            self.__loader()
 
     def __str__(self):
         return f"tag {self.hash}"
@@ -4,8 +4,8 @@ Represent a person with name and email, for either author or committer.
 Also pair with a date, as CommittedBy referencing a date and person.
 '''
 
-from datetime import datetime
-import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 from xonsh.lib.pretty import RepresentationPrinter
 
@@ -70,7 +70,16 @@ class Person:
         p.breakable()
         p.text(f'{self.email!r})')
 
-RE_SPLIT = re.compile(r'^(.*?) (\d+ [-+]\d{4})$')
+@lru_cache(maxsize=64)
+def _timezone(tz: str) -> timezone:
+    '''
+    The timezone for a git offset such as `-0500`. There are only ever a
+    few distinct offsets in a repository, so they are shared.
+    '''
+    if len(tz) != 5 or tz[0] not in '+-' or not tz[1:].isdigit():
+        raise ValueError(f"Invalid timezone offset: {tz!r}")
+    offset = timedelta(hours=int(tz[1:3]), minutes=int(tz[3:5]))
+    return timezone(-offset if tz[0] == '-' else offset)
 
 class CommittedBy:
     '''
@@ -96,20 +105,18 @@ class CommittedBy:
     def __init__(self, line: str, *,
                  repository: 'ct.GitRepository'):
         def loader():
-            match = RE_SPLIT.match(line)
-            if not match:
+            # `<name> <<email>> <timestamp> <offset>`; the name may hold spaces.
+            parts = line.rsplit(' ', 2)
+            if len(parts) != 3 or not parts[1].isdigit():
                 raise ValueError(f"Invalid CommittedBy line: {line!r}")
-            person, date = match.groups()
+            person, timestamp, _tz = parts
             person_ = repository.context.people.get(person)
             if person_ is None:
                 person_ = Person(person)
                 repository.context.people[person] = person_
             self.__person = person_
             def date_loader(self):
-                timestamp, _tz = date.split(' ')
-                tz = datetime.strptime(_tz, "%z").tzinfo
-                dt = datetime.fromtimestamp(int(timestamp), tz=tz)
-                return dt
+                return datetime.fromtimestamp(int(timestamp), tz=_timezone(_tz))
             self.__date = date_loader
             self.__loader = None
         self.__loader = loader
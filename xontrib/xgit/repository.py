@@ -11,11 +11,12 @@ from types import MappingProxyType
 from operator import xor
 from functools import reduce
 
+from xonsh.built_ins import XSH
 from xonsh.lib.pretty import RepresentationPrinter
 
 from xontrib.xgit.types import (
     InitFn, GitObjectType, ObjectId, GitRepositoryId,
-    TreeId, BlobId, TagId, CommitId,
+    TreeId, BlobId, TagId, CommitId, GitException,
 )
 import xontrib.xgit.ref_types as rt
 import xontrib.xgit.object_types as ot
@@ -24,6 +25,8 @@ import xontrib.xgit.worktree as wtree
 import xontrib.xgit.objects as obj
 from xontrib.xgit.ref import _GitRef
 from xontrib.xgit.git_cmd import _GitCmd
+from xontrib.xgit.object_cache import ObjectCache, MAX_OBJECT_SIZE
+from xontrib.xgit.lru import LRUCache
 from xontrib.xgit.views.json_types import JsonDescriber
 from xontrib.xgit.utils import shorten_branch, relative_to_home
 
@@ -40,6 +43,19 @@ The intent is to identify a default branch by examining the repository and/or wo
 
 
 RE_HEX = re.compile(r'^[0-9a-f]{6,}$')
+RE_FULL_HEX = re.compile(r'^(?:[0-9a-f]{40}|[0-9a-f]{64})$')
+
+DEFAULT_OBJECT_CACHE_SIZE = 65536
+'''
+How many objects each repository keeps for reuse, unless
+`$XGIT_OBJECT_CACHE_SIZE` says otherwise.
+'''
+
+def _known_size(size: 'int|InitFn[obj._GitObject,int]') -> int:
+    '''
+    The size, if it is already known, else -1.
+    '''
+    return -1 if callable(size) else size
 
 class _GitRepository(_GitCmd, ct.GitRepository):
     """
@@ -152,7 +168,14 @@ class _GitRepository(_GitCmd, ct.GitRepository):
         self.__worktrees[self.path.parent] = worktree
         return cast('ct.GitWorktree', worktree)
 
-    __objects: dict[ObjectId, 'ot.GitObject']
+    __objects: LRUCache[ObjectId, 'ot.GitObject']
+    @property
+    def objects(self) -> LRUCache[ObjectId, 'ot.GitObject']:
+        '''
+        The objects recently looked up in this repository, by hash.
+        Bounded by `$XGIT_OBJECT_CACHE_SIZE`; see its `stats()`.
+        '''
+        return self.__objects
 
 
     def get_ref(self, ref: 'rt.RefSpec|None' = None) -> 'rt.GitRef|None':
@@ -194,7 +217,7 @@ class _GitRepository(_GitCmd, ct.GitRepository):
     @overload
     def get_object(self, hash: 'ot.Blobish',
                    type: Literal['blob'],
-                   size: int=-1) -> 'ot.GitBlob':
+                   size: 'int|InitFn[obj._GitObject,int]'=-1) -> 'ot.GitBlob':
         ...
     @overload
     def get_object(self, hash: 'ot.Tagish',
@@ -203,23 +226,35 @@ class _GitRepository(_GitCmd, ct.GitRepository):
     @overload
     def get_object(self, hash: 'ot.Objectish',
                    type: Optional[GitObjectType]=None,
-                   size: int=-1
+                   size: 'int|InitFn[obj._GitObject,int]'=-1
                    ) -> 'ot.GitObject':
         ...
     def get_object(self, hash: 'ot.Objectish',
                    type: Optional[GitObjectType]=None,
-                   size: int=-1
+                   size: 'int|InitFn[obj._GitObject,int]'=-1
                    ) -> 'ot.GitObject':
+        # Objects never change, so one instance can serve every lookup,
+        # sharing whatever it has loaded.
+        objects = self.__objects
+        checked: str|None = None
+        # Hashes are by far the most common, and protocol `isinstance`
+        # checks are slow, so test for a string first.
         match hash:
-            case ot.GitObject():
-                return hash
-            case rt.GitRef():
-                hash = self.rev_parse(hash.name)
             case str(h):
                 h = h.strip()
+                # Most often a full hash, already loaded: return that
+                # before any parsing or resolving.
+                if len(h) in (40, 64):
+                    found = objects.get(h)
+                    if found is not None and (type is None or found.type == type):
+                        return found
+                    checked = h
                 if not h:
                     raise ValueError(f"Invalid hash: {h!r}")
-                if RE_HEX.match(h):
+                if RE_FULL_HEX.match(h):
+                    # Already resolved; `git rev-parse` would return it as is.
+                    hash = ObjectId(h)
+                elif RE_HEX.match(h):
                     try:
                         hash = self.rev_parse(hash)
                     except ValueError:
@@ -228,20 +263,34 @@ class _GitRepository(_GitCmd, ct.GitRepository):
                     if not h.startswith('refs/'):
                         h = f'refs/heads/{hash}'
                     hash = self.rev_parse(h)
+            case ot.GitObject():
+                return hash
+            case rt.GitRef():
+                hash = self.rev_parse(hash.name)
             case _:
                 raise ValueError(f"Invalid hash: {hash!r}")
+        if hash != checked:
+            # Resolved from a name, an abbreviation, or a ref.
+            found = objects.get(hash)
+            if found is not None and (type is None or found.type == type):
+                return found
         match type:
             case 'commit':
-                return obj._GitCommit(hash, repository=self)
+                found = obj._GitCommit(hash, _known_size(size), repository=self)
             case 'tree':
-                return obj._GitTree(TreeId(hash), repository=self)
+                found = obj._GitTree(TreeId(hash), repository=self)
             case 'blob':
-                return obj._GitBlob(BlobId(hash), size, repository=self)
+                found = obj._GitBlob(BlobId(hash), size, repository=self)
             case 'tag':
-                return obj._GitTagObject(TagId(hash), repository=self)
+                found = obj._GitTagObject(TagId(hash), _known_size(size),
+                                          repository=self)
             case None:
-                type = cast(GitObjectType, self.git_string('cat-file', '-t', hash))
-        return self.get_object(hash, type, size)
+                _, type, obj_size = self.cat_file_check(hash)
+                if callable(size) or size < 0:
+                    size = obj_size
+                return self.get_object(hash, type, size)
+        objects[hash] = found
+        return found
 
     def __init__(self, *args,
                  context: 'ct.GitContext',
@@ -280,7 +329,6 @@ class _GitRepository(_GitCmd, ct.GitRepository):
                     case ['HEAD', c]:
                         id = CommitId(ObjectId(c))
                         commit = self.get_object(id, 'commit')
-                        self.__objects[commit.hash] = commit
                     case ['branch', b]:
                         b = b.strip()
                         branch = _GitRef(b, repository=self) if b else None
@@ -323,14 +371,149 @@ class _GitRepository(_GitCmd, ct.GitRepository):
                         prunable = ''
             return result
         self.__worktrees = init_worktrees
-        self.__objects = {}
+        env = XSH.env
+        size = env.get('XGIT_OBJECT_CACHE_SIZE') if env is not None else None
+        self.__objects = LRUCache(int(size or DEFAULT_OBJECT_CACHE_SIZE))
+        self.__trees_at = LRUCache(256)
+        def init_object_cache(self: '_GitRepository') -> ObjectCache|None:
+            env = XSH.env
+            cache_dir = env.get('XGIT_CACHE_DIR') if env is not None else None
+            if not cache_dir:
+                return None
+            return ObjectCache.for_repository(cache_dir, self.path)
+        self.__object_cache = init_object_cache
+
+
+    __object_cache: 'ObjectCache|None|InitFn[_GitRepository, ObjectCache|None]'
+    @property
+    def object_cache(self) -> ObjectCache|None:
+        '''
+        The persistent cache of object data, or `None` if `$XGIT_CACHE_DIR`
+        is not set.
+        '''
+        if callable(self.__object_cache):
+            self.__object_cache = self.__object_cache(self)
+        return self.__object_cache
+
+
+    def cat_file_batch(self, oid: str, /) -> bytes:
+        '''
+        Get the raw content of an object, from the persistent cache if
+        it is there. Only full hashes are cached; anything else could
+        name a different object later.
+        '''
+        cache = self.object_cache
+        if cache is None or not RE_FULL_HEX.match(oid):
+            return super().cat_file_batch(oid)
+        data = cache.get(oid, 'object')
+        if data is None:
+            data = super().cat_file_batch(oid)
+            if len(data) <= MAX_OBJECT_SIZE:
+                cache.put(oid, 'object', data)
+        return data
+
+
+    def load_objects(self, /, *hashes: 'ot.Objectish') -> list['ot.GitObject']:
+        '''
+        Get several objects, loaded and ready to use.
+
+        Rather than a round trip to git per object (or two, when the type
+        isn't known), the types of all the new objects are looked up in one
+        pipelined round trip, and the contents of all that need loading in
+        another.
+
+        PARAMETERS
+        ----------
+        hashes: Objectish
+            The objects to get.
+
+        RETURNS
+        -------
+        list[GitObject]
+            The objects, in the order given.
+        '''
+        objects = self.__objects
+        new = [h for h in dict.fromkeys(hashes)
+               if isinstance(h, str) and RE_FULL_HEX.match(h) and h not in objects]
+        info = {h: (type, size) for h, type, size in self.cat_file_check_many(*new)}
+        result = [self.get_object(h, *info[h]) if h in info else self.get_object(h)
+                  for h in hashes]
+        pending = [o for o in {id(o): o for o in result}.values()
+                   if isinstance(o, obj._GitObject) and o._unloaded()]
+        fetched = self.cat_file_batch_many(*(o.hash for o in pending))
+        for o, (_, _, raw) in zip(pending, fetched, strict=True):
+            o._load_from(raw)
+        return result
+
+    def prime_tree(self, tree: 'ot.Treeish', /) -> 'ot.GitTree':
+        '''
+        Load a tree and every tree below it, fetching each level of
+        the hierarchy from git in one round trip.
+
+        PARAMETERS
+        ----------
+        tree: Treeish
+            The tree to load.
+
+        RETURNS
+        -------
+        GitTree
+            The tree, with all its subtrees loaded.
+        '''
+        return cast(obj._GitTree, self.get_object(tree, 'tree'))._expand_all()
+
+    __trees_at: LRUCache[tuple[CommitId, PurePosixPath], TreeId]
+    '''
+    The trees found by `tree_at`. A commit's trees never change, so
+    listing sibling paths reuses the lookup.
+    '''
+
+    def tree_at(self, commit: CommitId, path: PurePosixPath, /) -> 'ot.GitTree':
+        '''
+        Get the tree at `path` in `commit`, looking it up directly rather
+        than loading every tree on the way down to it.
+
+        PARAMETERS
+        ----------
+        commit: CommitId
+            The commit to look in.
+        path: PurePosixPath
+            The path of the tree, relative to the top of the commit.
+
+        RETURNS
+        -------
+        GitTree
+            The tree at `path`.
+        '''
+        key = (commit, path)
+        hash = self.__trees_at.get(key)
+        if hash is None:
+            try:
+                found, type, _ = self.cat_file_check(f'{commit}:{path}')
+            except GitException:
+                raise ValueError(f"{path} is not a directory tree") from None
+            if type != 'tree':
+                raise ValueError(f"{path} is not a directory tree: {type}")
+            hash = self.__trees_at[key] = TreeId(found)
+        return cast(ot.GitTree, self.get_object(hash, 'tree'))
+
+    def close(self):
+        '''
+        Shut down any persistent `git cat-file` processes, and close the
+        object cache.
+        '''
+        super().close()
+        self.__trees_at.clear()
+        if isinstance(self.__object_cache, ObjectCache):
+            self.__object_cache.close()
 
     def add_reference(self, target: ObjectId, source: 'ot.GitObject|rt.GitRef'):
         '''
         Add a reference to an object.
         '''
+        # Check the concrete classes first; protocol checks are slow.
         match source:
-            case ot.GitObject():
+            case obj._GitObject() | ot.GitObject():
                 match source.type:
                     case 'commit':
                         type = 'commit'
@@ -341,7 +524,7 @@ class _GitRepository(_GitCmd, ct.GitRepository):
                     case _:
                         raise ValueError(f"Invalid object type: {source.type}")
                 self.context.add_reference(target, self.id, source.hash, type)
-            case rt.GitRef():
+            case _GitRef() | rt.GitRef():
                 src_path = PurePosixPath(source.name)
                 self.context.add_reference(target, self.id, src_path, 'ref')
             case _:
@@ -36,13 +36,6 @@ from xontrib.xgit.types import (
 )
 
 
-def _u(s: str) -> str:
-    return s.replace('-', '_')
-
-def _h(s: str) -> str:
-    return s.replace('_', '-')
-
-
 C = TypeVar('C', bound='Invoker')
 
 class Runner(Generic[C]):
@@ -242,7 +235,10 @@ class RunnerPerSessionRunner(BaseSessionRunner[RPSI]):
         Runs the command with the given arguments and session arguments.
         '''
         __tracebackhide__ = True
-        kwargs.update(self.session_args)
+        # Already filtered to the command's parameters by `inject`.
+        if (session_args := self.__session_args) is None:
+            raise GitNoSessionException(self.__name__)
+        kwargs.update(session_args)
         return self.invoker(*args, **kwargs)
 
 
@@ -335,12 +331,13 @@ class PrefixCommand(Command):
     '''
 
     __subcommands: Mapping[str, 'Command']
+    __subcommands_view: MappingProxyType[str, 'Command']
     @property
     def subcommands(self) -> MappingProxyType[str, 'Command']:
         '''
         The subcommands that are available to the prefix
         '''
-        return MappingProxyType(self.__subcommands)
+        return self.__subcommands_view
 
 
     def __init__(self, invoker : 'PrefixCommandInvoker', /, *,
@@ -359,6 +356,7 @@ class PrefixCommand(Command):
         super().__init__(invoker,
                         **kwargs)
         self.__subcommands = subcommands
+        self.__subcommands_view = MappingProxyType(subcommands)
 
 
     def __call__(self, args: list[str|Any], **kwargs: Any) -> Any:
@@ -369,8 +367,8 @@ class PrefixCommand(Command):
         __tracebackhide__ = True
         subcmd_name = args.pop(0)
 
-        if subcmd_name not in self.subcommands:
+        subcmd = self.__subcommands.get(subcmd_name)
+        if subcmd is None:
             raise GitValueError(f"Invalid subcommand: {subcmd_name}")
-        subcmd = self.subcommands[subcmd_name]
 
         return subcmd(args, **kwargs)
\ No newline at end of file
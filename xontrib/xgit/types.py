@@ -6,8 +6,10 @@ Types for public use will be defined in the xgit module via `__init__.py`. and t
 '''
 
 from pathlib import Path
+from sys import intern
+from types import MappingProxyType
 from typing import (
-     Generic, NewType, Optional, Protocol, TypeVar, ParamSpec,
+     Generic, NewType, Optional, Protocol, TypeVar, ParamSpec, cast,
 )
 
 from xontrib.xgit.ids import ObjectId
@@ -78,6 +80,16 @@ A unique identifier for a git repository.
 XOR of the commit IDs of every root commit.
 '''
 
+_OBJECT_TYPES: MappingProxyType[bytes|str, GitObjectType] = MappingProxyType({
+    k: cast(GitObjectType, intern(t))
+    for t in ("commit", "tree", "blob", "tag")
+    for k in (t, t.encode())
+})
+'''
+The object types, by name as read from git (`bytes` or `str`). Looking them
+up gives the shared literal strings rather than a fresh copy per object.
+'''
+
 class _NoValue:
     """A type for a marker for a value that is not passed in."""
     __match_args__ = ()